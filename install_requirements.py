@@ -6,6 +6,15 @@ Installation script for AutoTrain Advanced Image Training dependencies
 import subprocess
 import sys
 import os
+from pathlib import Path
+
+PIP_CACHE_DIR = Path.home() / ".cache" / "autotrain-pip"
+
+def _pip_install(args):
+    """Run pip install with the given extra arguments"""
+    return subprocess.run([
+        sys.executable, "-m", "pip", "install", *args
+    ], capture_output=True, text=True)
 
 def install_requirements():
     """Install requirements from requirements.txt"""
@@ -18,10 +27,17 @@ def install_requirements():
             print("❌ requirements.txt not found!")
             return False
         
-        # Install requirements
-        result = subprocess.run([
-            sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
-        ], capture_output=True, text=True)
+        # Installing wheel first activates pip's automatic wheel cache,
+        # so repeat installs reuse built wheels instead of rebuilding sdists
+        _pip_install(["wheel"])
+
+        # Prefer pre-built wheels, skip byte-compilation, and keep a local
+        # wheel cache so repeat installs are near-instant
+        base_flags = ["--prefer-binary", "--no-compile", "--cache-dir", str(PIP_CACHE_DIR)]
+        result = _pip_install([*base_flags, "--only-binary", ":all:", "-r", "requirements.txt"])
+        if result.returncode != 0:
+            # Some packages may only ship sdists; retry allowing source builds
+            result = _pip_install([*base_flags, "-r", "requirements.txt"])
         
         if result.returncode == 0:
             print("✅ All dependencies installed successfully!")
@@ -2,13 +2,25 @@
 AutoTrain Advanced - Main Entry Point
 """
 
+import os
+
 import uvicorn
-from src.autotrain.api.main import app
 
 if __name__ == "__main__":
+    # reload runs a single supervised process and precludes workers; set
+    # UVICORN_RELOAD=0 to turn it off and scale out with WEB_CONCURRENCY.
+    # WEB_CONCURRENCY > 1 is opt-in because job state lives in-process.
+    reload = os.getenv("UVICORN_RELOAD", "1") == "1"
     uvicorn.run(
         "src.autotrain.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=reload,
+        workers=None if reload else int(os.getenv("WEB_CONCURRENCY", "1")),
+        # loop/http default to "auto": uvloop + httptools when installed
+        # (uvicorn[standard] on Linux), stdlib fallbacks on Windows.
+        loop=os.getenv("UVICORN_LOOP", "auto"),
+        http=os.getenv("UVICORN_HTTP", "auto"),
+        backlog=2048,
+        timeout_keep_alive=15,
     )
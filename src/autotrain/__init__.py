@@ -24,35 +24,62 @@ if str(_src_dir) not in sys.path:
     sys.path.insert(0, str(_src_dir))
 
 
-os.environ["BITSANDBYTES_NOWELCOME"] = "1"
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
-os.environ["TOKENIZERS_PARALLELISM"] = "false"
+# setdefault keeps user-supplied values and avoids rewriting environ on reloads
+os.environ.setdefault("BITSANDBYTES_NOWELCOME", "1")
+os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "3")
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
 
 
-import warnings
-
-
-try:
-    import torch._dynamo  # type: ignore[attr-defined]
-
-    torch._dynamo.config.suppress_errors = True  # type: ignore[attr-defined]
-except ImportError:
-    pass
-
-from .logging import Logger
-
-
-warnings.filterwarnings("ignore", category=UserWarning, module="tensorflow")
-warnings.filterwarnings("ignore", category=UserWarning, module="transformers")
-warnings.filterwarnings("ignore", category=UserWarning, module="peft")
-warnings.filterwarnings("ignore", category=UserWarning, module="accelerate")
-warnings.filterwarnings("ignore", category=UserWarning, module="datasets")
-warnings.filterwarnings("ignore", category=FutureWarning, module="accelerate")
-warnings.filterwarnings("ignore", category=UserWarning, module="huggingface_hub")
-
-logger = Logger().get_logger()
 __version__ = "0.8.37.dev0"
 
+_warnings_configured = False
+
+_FILTERS = (
+    ("ignore", UserWarning, "tensorflow"),
+    ("ignore", UserWarning, "transformers"),
+    ("ignore", UserWarning, "peft"),
+    ("ignore", UserWarning, "accelerate"),
+    ("ignore", UserWarning, "datasets"),
+    ("ignore", UserWarning, "huggingface_hub"),
+    ("ignore", FutureWarning, "accelerate"),
+)
+
+
+def _configure_warnings():
+    """Silence noisy third-party warnings; runs once, on first logger access."""
+    global _warnings_configured
+    if _warnings_configured:
+        return
+    _warnings_configured = True
+
+    import warnings
+
+    for action, category, module in _FILTERS:
+        warnings.filterwarnings(action, category=category, module=module)
+
+    # Only touch torch._dynamo when torch is already loaded (training
+    # entrypoints); API-only processes never pay the torch import here.
+    if "torch" in sys.modules:
+        try:
+            import torch._dynamo  # type: ignore[attr-defined]
+
+            torch._dynamo.config.suppress_errors = True  # type: ignore[attr-defined]
+        except ImportError:
+            pass
+
+
+def __getattr__(name):
+    # PEP 562: defer Logger construction (and the warning setup) so that
+    # `import autotrain` stays cheap for API workers and CLI --help.
+    if name == "logger":
+        _configure_warnings()
+        from .logging import Logger
+
+        logger = Logger().get_logger()
+        globals()["logger"] = logger
+        return logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def is_colab():
     try:
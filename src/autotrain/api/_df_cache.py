@@ -0,0 +1,65 @@
+"""
+Shared DataFrame cache for the API routers.
+
+Re-parsing a multi-MB CSV/Parquet on every request dominates latency, so
+reads are memoised on (path, mtime_ns, size). A changed file gets a new
+cache key automatically; deletes/rewrites should call invalidate_df_cache.
+"""
+
+from functools import lru_cache
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+
+def _read_csv_fast(path: str, sep: str) -> pd.DataFrame:
+    """Parse a CSV with pyarrow's multi-threaded SIMD reader, falling back to pandas."""
+    try:
+        table = pacsv.read_csv(
+            path,
+            parse_options=pacsv.ParseOptions(delimiter=sep),
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+        )
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    except Exception:
+        # pyarrow is stricter than pandas (ragged rows, exotic encodings);
+        # keep the permissive parser as a fallback.
+        return pd.read_csv(path, sep=sep)
+
+
+@lru_cache(maxsize=32)
+def _load(path: str, mtime_ns: int, size: int, kind: str, sep: str) -> pd.DataFrame:
+    if kind == "parquet":
+        return pd.read_parquet(path)
+    return _read_csv_fast(path, sep)
+
+
+def load_df(filepath: str, sep: str = ",") -> pd.DataFrame:
+    """Load a CSV or Parquet dataset, reusing a cached parse when the file is unchanged."""
+    stat = os.stat(filepath)
+    kind = "parquet" if filepath.endswith('.parquet') else "csv"
+    return _load(filepath, stat.st_mtime_ns, stat.st_size, kind, sep)
+
+
+def batch_records(batch, limit: int) -> list:
+    """First `limit` rows of an Arrow record batch as JSON-ready dicts.
+
+    Replaces the fillna('').to_dict('records') pattern: only string columns
+    get nulls replaced with '', numbers stay numbers (missing -> JSON null),
+    and the per-cell walk happens in Arrow instead of pandas.
+    None (empty file) -> [].
+    """
+    if batch is None:
+        return []
+    table = pa.Table.from_batches([batch.slice(0, limit)])
+    for i, field in enumerate(table.schema):
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            table = table.set_column(i, field, pc.fill_null(table.column(i), ""))
+    return table.to_pylist()
+
+
+def invalidate_df_cache() -> None:
+    """Drop all cached DataFrames (call after rewriting or deleting a dataset)."""
+    _load.cache_clear()
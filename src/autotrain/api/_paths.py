@@ -0,0 +1,43 @@
+"""
+Shared dataset path resolution for the API routers.
+
+Several handlers used to open-code the same cascade of os.path.exists
+checks (uploads/ -> data/ -> processed parquet, old and new naming).
+resolve_dataset does one stat per candidate and returns the first hit.
+"""
+
+import os
+from typing import Iterator, Optional, Tuple
+
+UPLOADS_DIR = "data/uploads"
+DATA_ROOT = "data"
+PROCESSED_DIR = "data/processed"
+
+
+def _candidates(name: str) -> Iterator[Tuple[str, str]]:
+    if name.endswith('.parquet'):
+        yield f"{UPLOADS_DIR}/{name}", "parquet"
+        yield f"{DATA_ROOT}/{name}", "parquet"
+        yield f"{PROCESSED_DIR}/{name}", "parquet"
+    else:
+        yield f"{UPLOADS_DIR}/{name}", "csv"
+        yield f"{DATA_ROOT}/{name}", "csv"
+        base = name[:-4] if name.endswith('.csv') else name
+        # New naming convention (same name, different extension), then the
+        # old processed_ prefix for backward compatibility.
+        yield f"{PROCESSED_DIR}/{base}.parquet", "parquet"
+        yield f"{PROCESSED_DIR}/processed_{base}.parquet", "parquet"
+
+
+def resolve_dataset(name: str) -> Optional[Tuple[str, str]]:
+    """Resolve a dataset name to (filepath, kind) where kind is 'csv' or 'parquet'.
+
+    Returns None when no candidate location exists.
+    """
+    for candidate, kind in _candidates(name):
+        try:
+            os.stat(candidate)
+        except OSError:
+            continue
+        return candidate, kind
+    return None
@@ -0,0 +1,94 @@
+"""
+Cheap mtime+size lookups for cache-freshness checks.
+
+On Linux, statx(2) with AT_STATX_DONT_SYNC returns cached inode data
+without forcing a network-filesystem revalidation, and only the fields we
+ask for (STATX_MTIME | STATX_SIZE) are filled in. Everywhere else — or if
+glibc lacks statx — this degrades to a plain os.stat.
+"""
+
+import ctypes
+import errno
+import os
+import sys
+from typing import NamedTuple
+
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_MTIME = 0x40
+_STATX_SIZE = 0x200
+_WANTED = _STATX_MTIME | _STATX_SIZE
+
+
+class FreshnessStat(NamedTuple):
+    st_mtime: float
+    st_mtime_ns: int
+    st_size: int
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    # Layout per struct statx in linux/stat.h
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16 * 1),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        ("_spare2", ctypes.c_uint64 * 14),
+    ]
+
+
+_statx = None
+if sys.platform == "linux":
+    try:
+        _libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        _statx = _libc.statx
+        _statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.POINTER(_Statx)]
+        _statx.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _statx = None
+
+
+def freshness_stat(path: str) -> FreshnessStat:
+    """Return (st_mtime, st_mtime_ns, st_size) for `path` as cheaply as possible."""
+    global _statx
+    if _statx is not None:
+        buf = _Statx()
+        rc = _statx(_AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC, _WANTED, ctypes.byref(buf))
+        if rc == 0 and (buf.stx_mask & _WANTED) == _WANTED:
+            mtime = buf.stx_mtime
+            return FreshnessStat(
+                st_mtime=mtime.tv_sec + mtime.tv_nsec * 1e-9,
+                st_mtime_ns=mtime.tv_sec * 1_000_000_000 + mtime.tv_nsec,
+                st_size=buf.stx_size,
+            )
+        err = ctypes.get_errno()
+        if rc != 0 and err == errno.ENOSYS:
+            _statx = None  # old kernel: stop trying
+        elif rc != 0 and err in (errno.ENOENT, errno.ENOTDIR):
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+    st = os.stat(path)
+    return FreshnessStat(st_mtime=st.st_mtime, st_mtime_ns=st.st_mtime_ns, st_size=st.st_size)
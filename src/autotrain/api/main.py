@@ -4,11 +4,23 @@ FastAPI main application
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 import os
 
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultResponse
+
+from ..core.config import initialize_storage
 from .routers import datasets, eda, training, export, image_training, ai_analysis, preprocessing
 
+# Create the data directories up front; the artifacts mount below and the
+# routers all assume they exist
+initialize_storage()
+
 
 FRONTEND_ORIGINS = [
     "http://localhost:5173",
@@ -23,9 +35,15 @@ FRONTEND_ORIGINS = [
 app = FastAPI(
     title="AutoTrain Advanced API",
     description="End-to-end ML pipeline API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultResponse
 )
 
+# Response compression: level 1 shrinks text-heavy JSON several-fold at
+# negligible CPU; small payloads and responses that already declare a
+# Content-Encoding (binary downloads) are left alone.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -72,4 +90,16 @@ async def api_health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop/http default to "auto": uvloop + httptools when installed
+    # (uvicorn[standard] on Linux), stdlib fallbacks on Windows.
+    # WEB_CONCURRENCY > 1 is opt-in because job state lives in-process.
+    uvicorn.run(
+        "autotrain.api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        loop=os.getenv("UVICORN_LOOP", "auto"),
+        http=os.getenv("UVICORN_HTTP", "auto"),
+        backlog=2048,
+        timeout_keep_alive=15,
+    )
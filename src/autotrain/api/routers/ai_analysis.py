@@ -4,9 +4,11 @@ AI-powered dataset analysis API endpoints
 
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
+import asyncio
 import pandas as pd
-import os
 from ..schemas import DatasetInfo
+from .._df_cache import load_df
+from .._paths import resolve_dataset
 from ...services.ai_analysis_service import AIAnalysisService
 
 router = APIRouter()
@@ -22,37 +24,18 @@ async def analyze_dataset(dataset_name: str, separator: str = ",") -> Dict[str,
     """
     try:
         # Resolve dataset location: uploads/, data/, or processed parquet
-        filepath = f"data/uploads/{dataset_name}"
-        if not os.path.exists(filepath):
-            alt_path = f"data/{dataset_name}"
-            if os.path.exists(alt_path):
-                filepath = alt_path
-            else:
-                # Check if it's already a parquet file in processed directory
-                if dataset_name.endswith('.parquet'):
-                    parquet_path = f"data/processed/{dataset_name}"
-                    if os.path.exists(parquet_path):
-                        filepath = parquet_path
-                    else:
-                        raise HTTPException(status_code=404, detail="Dataset not found")
-                else:
-                    # Try to find processed parquet version
-                    parquet_name = dataset_name.replace('.csv', '.parquet')
-                    parquet_path = f"data/processed/processed_{parquet_name}"
-                    if os.path.exists(parquet_path):
-                        filepath = parquet_path
-                    else:
-                        raise HTTPException(status_code=404, detail="Dataset not found")
-        
-        # Read dataset (CSV or Parquet)
-        if filepath.endswith('.parquet'):
-            df = pd.read_parquet(filepath)
-        else:
-            df = pd.read_csv(filepath, sep=separator)
-        
+        resolved = resolve_dataset(dataset_name)
+        if resolved is None:
+            raise HTTPException(status_code=404, detail="Dataset not found")
+        filepath, _ = resolved
+
+        # Read dataset (CSV or Parquet), reusing the cached parse when unchanged;
+        # run the blocking parse/analysis off the event loop
+        df = await asyncio.to_thread(load_df, filepath, separator)
+
         # Perform AI analysis
         ai_service = get_ai_service()
-        analysis_result = ai_service.analyze_dataset(df, dataset_name)
+        analysis_result = await asyncio.to_thread(ai_service.analyze_dataset, df, dataset_name)
         
         return {
             "dataset_name": dataset_name,
@@ -71,38 +54,19 @@ async def get_dataset_suggestions(dataset_name: str, separator: str = ",") -> Di
     """
     try:
         # Resolve dataset location: uploads/, data/, or processed parquet
-        filepath = f"data/uploads/{dataset_name}"
-        if not os.path.exists(filepath):
-            alt_path = f"data/{dataset_name}"
-            if os.path.exists(alt_path):
-                filepath = alt_path
-            else:
-                # Check if it's already a parquet file in processed directory
-                if dataset_name.endswith('.parquet'):
-                    parquet_path = f"data/processed/{dataset_name}"
-                    if os.path.exists(parquet_path):
-                        filepath = parquet_path
-                    else:
-                        raise HTTPException(status_code=404, detail="Dataset not found")
-                else:
-                    # Try to find processed parquet version
-                    parquet_name = dataset_name.replace('.csv', '.parquet')
-                    parquet_path = f"data/processed/processed_{parquet_name}"
-                    if os.path.exists(parquet_path):
-                        filepath = parquet_path
-                    else:
-                        raise HTTPException(status_code=404, detail="Dataset not found")
-        
-        # Read dataset (CSV or Parquet)
-        if filepath.endswith('.parquet'):
-            df = pd.read_parquet(filepath)
-        else:
-            df = pd.read_csv(filepath, sep=separator)
-        
+        resolved = resolve_dataset(dataset_name)
+        if resolved is None:
+            raise HTTPException(status_code=404, detail="Dataset not found")
+        filepath, _ = resolved
+
+        # Read dataset (CSV or Parquet), reusing the cached parse when unchanged;
+        # keep the blocking work off the event loop
+        df = await asyncio.to_thread(load_df, filepath, separator)
+
         # Get basic info and simple suggestions
         ai_service = get_ai_service()
-        dataset_info = ai_service._get_dataset_info(df)
-        fallback_recommendations = ai_service._get_fallback_recommendations(df)
+        dataset_info = await asyncio.to_thread(ai_service._get_dataset_info, df)
+        fallback_recommendations = await asyncio.to_thread(ai_service._get_fallback_recommendations, df)
         
         return {
             "dataset_name": dataset_name,
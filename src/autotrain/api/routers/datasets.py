@@ -2,16 +2,29 @@
 Dataset management API endpoints
 """
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Form
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, UploadFile, File, HTTPException, Form, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
 from typing import List, Tuple, Optional, Dict
-import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import asyncio
+import hashlib
 import os
-import csv
 import json
+import shutil
+import time
 from datetime import datetime
 from threading import Lock
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from ..schemas import DatasetInfo, DatasetList
+from .._df_cache import batch_records, invalidate_df_cache
+from .._paths import resolve_dataset, UPLOADS_DIR, DATA_ROOT, PROCESSED_DIR
+from .._statx import freshness_stat
 
 router = APIRouter()
 
@@ -23,68 +36,195 @@ _metadata_lock = Lock()
 def _load_metadata_store() -> Dict[str, Dict]:
     if os.path.exists(METADATA_FILE):
         try:
-            with open(METADATA_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    return data
+            with open(METADATA_FILE, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if isinstance(data, dict):
+                return data
         except Exception as e:
             print(f"Warning: Failed to load dataset metadata store: {e}")
     return {}
 
 def _save_metadata_store(store: Dict[str, Dict]) -> None:
+    # orjson serializes in C straight to bytes (one write, no per-token
+    # Python indenting); stdlib json stays as the fallback.
     try:
-        with open(METADATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(store, f, indent=2)
+        tmp_path = METADATA_FILE + ".tmp"
+        if orjson is not None:
+            buf = orjson.dumps(store, option=orjson.OPT_INDENT_2)
+        else:
+            buf = json.dumps(store, indent=2).encode("utf-8")
+        with open(tmp_path, "wb") as f:
+            f.write(buf)
+        os.replace(tmp_path, METADATA_FILE)
     except Exception as e:
         print(f"Warning: Failed to save dataset metadata store: {e}")
 
 _metadata_store = _load_metadata_store()
 
+# Persistence is debounced: updates mark the store dirty and a background
+# flusher writes datasets.json at most every 0.5 s (atomically, via .tmp +
+# os.replace) instead of rewriting it once per refreshed file.
+_store_dirty = False
+
+def _mark_dirty() -> None:
+    global _store_dirty
+    _store_dirty = True
+
+async def _flush_metadata_store_loop() -> None:
+    global _store_dirty
+    while True:
+        await asyncio.sleep(0.5)
+        if not _store_dirty:
+            continue
+        with _metadata_lock:
+            snapshot = _metadata_store
+            _store_dirty = False
+        await asyncio.to_thread(_save_metadata_store, snapshot)
+
+# The loop only holds a weak reference to running tasks, so the flusher
+# must be anchored here or it can be garbage-collected mid-run and
+# silently stop persisting.
+_flusher_task: Optional[asyncio.Task] = None
+
+@router.on_event("startup")
+async def _start_metadata_flusher() -> None:
+    global _flusher_task
+    _flusher_task = asyncio.create_task(_flush_metadata_store_loop())
+
+@router.on_event("shutdown")
+async def _stop_metadata_flusher() -> None:
+    global _store_dirty
+    if _flusher_task is not None:
+        _flusher_task.cancel()
+    # Final flush: the debounce window must not drop the last updates on a
+    # clean shutdown
+    if _store_dirty:
+        with _metadata_lock:
+            snapshot = _metadata_store
+            _store_dirty = False
+        await asyncio.to_thread(_save_metadata_store, snapshot)
+
 def _metadata_key(filepath: str) -> str:
     return os.path.abspath(filepath).replace("\\", "/")
 
+# Short-lived front cache over the persistent store: within the TTL a repeat
+# lookup for the same file returns the cached dict with no stat syscall and
+# no mtime/size comparison at all, so a hot list_datasets is O(1) per
+# already-seen file and burst refreshes collapse into one. The JSON store
+# stays the source of truth; this only absorbs request bursts.
+_META_TTL = 5.0
+_META_TTL_MAXSIZE = 4096
+_meta_ttl_cache: Dict[str, Tuple[float, Dict]] = {}
+
+def _meta_ttl_get(key: str) -> Optional[Dict]:
+    entry = _meta_ttl_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def _meta_ttl_put(key: str, metadata: Dict) -> None:
+    if len(_meta_ttl_cache) >= _META_TTL_MAXSIZE:
+        _meta_ttl_cache.clear()  # everything expires within _META_TTL anyway
+    _meta_ttl_cache[key] = (time.monotonic() + _META_TTL, metadata)
+
+_CSV_DELIMITERS = (b",", b";", b"\t", b"|")
+
 def _detect_csv_delimiter(filepath: str) -> str:
+    # Byte-frequency detector over an 8 KB sample: csv.Sniffer walks all 127
+    # ASCII chars per line and can backtrack badly on pathological input.
+    # The delimiter whose per-line count is most consistent (then largest) wins.
     try:
-        with open(filepath, "r", newline="", encoding="utf-8", errors="ignore") as f:
+        with open(filepath, "rb") as f:
             sample = f.read(8192)
-            f.seek(0)
-            dialect = csv.Sniffer().sniff(sample, delimiters=[",", ";", "\t", "|"])
-            return dialect.delimiter
+        lines = [line for line in sample.split(b"\n")[:20] if line.strip()]
+        if not lines:
+            return ","
+
+        best_delimiter = ","
+        best_score = None
+        for delimiter in _CSV_DELIMITERS:
+            counts = sorted(line.count(delimiter) for line in lines)
+            median = counts[len(counts) // 2]
+            if median == 0:
+                continue
+            mean = sum(counts) / len(counts)
+            variance = sum((c - mean) ** 2 for c in counts) / len(counts)
+            score = (variance, -median)
+            if best_score is None or score < best_score:
+                best_score = score
+                best_delimiter = delimiter.decode()
+        return best_delimiter
     except Exception:
         return ","
 
 def _compute_csv_metadata(filepath: str) -> Tuple[int, int, str]:
+    # Quote-free files (the common case) are counted by newline bytes in
+    # 1 MB chunks, which runs at memory bandwidth. If the sample contains a
+    # quote character, fields may embed newlines, so the count is handed to
+    # pyarrow's streaming parser instead — still C++ and multithreaded, and
+    # exact where the byte count would overshoot.
     delimiter = _detect_csv_delimiter(filepath)
     rows = 0
     columns = 0
     try:
-        with open(filepath, "r", newline="", encoding="utf-8", errors="ignore") as f:
-            reader = csv.reader(f, delimiter=delimiter)
-            headers = next(reader, [])
-            columns = len(headers)
-            for _ in reader:
-                rows += 1
+        with open(filepath, "rb") as f:
+            sample = f.read(8192)
+            if b'"' in sample:
+                parse_options = pacsv.ParseOptions(delimiter=delimiter, newlines_in_values=True)
+                with pacsv.open_csv(filepath, parse_options=parse_options,
+                                    read_options=pacsv.ReadOptions(block_size=1 << 20)) as reader:
+                    columns = len(reader.schema.names)
+                    rows = sum(batch.num_rows for batch in reader)
+                return rows, columns, delimiter
+
+            f.seek(0)
+            header = f.readline()
+            if header.strip():
+                columns = header.count(delimiter.encode()) + 1
+            last_chunk = b"\n"
+            while chunk := f.read(1 << 20):
+                rows += chunk.count(b"\n")
+                last_chunk = chunk
+            if not last_chunk.endswith(b"\n"):
+                rows += 1  # final line without a trailing newline
     except Exception as e:
         print(f"Warning: Could not compute CSV metadata for {filepath}: {e}")
     return rows, columns, delimiter
 
 def _compute_parquet_metadata(filepath: str) -> Tuple[int, int]:
     try:
-        df = pd.read_parquet(filepath)
-        return len(df), len(df.columns)
+        # Row/column counts live in the Parquet footer; no data pages are read.
+        metadata = pq.ParquetFile(filepath).metadata
+        return metadata.num_rows, metadata.num_columns
     except Exception as e:
         print(f"Warning: Could not compute Parquet metadata for {filepath}: {e}")
         return 0, 0
 
-def _get_or_refresh_metadata(filepath: str, file_type: str) -> Dict[str, Optional[int]]:
+def _get_or_refresh_metadata(filepath: str, file_type: str, stat=None) -> Dict[str, Optional[int]]:
     global _metadata_store
     key = _metadata_key(filepath)
-    try:
-        stat = os.stat(filepath)
-    except FileNotFoundError:
-        return {"rows": 0, "columns": 0, "size": 0, "file_type": file_type}
+
+    cached = _meta_ttl_get(key)
+    if cached is not None:
+        if stat is None:
+            return cached
+        # Caller already holds a stat (directory listing): trust the cache
+        # only while it still matches what the filesystem reports.
+        if cached.get("modified_at") == stat.st_mtime and cached.get("size") == stat.st_size:
+            return cached
+
+    if stat is None:
+        try:
+            # statx(AT_STATX_DONT_SYNC) where available: mtime+size only,
+            # no attribute revalidation on network filesystems
+            stat = freshness_stat(filepath)
+        except FileNotFoundError:
+            return {"rows": 0, "columns": 0, "size": 0, "file_type": file_type}
 
     needs_refresh = True
+    # Plain read of the current snapshot: writers replace the whole dict
+    # rather than mutating it, so no lock is needed here.
     existing = _metadata_store.get(key)
     if existing:
         stored_mtime = existing.get("modified_at")
@@ -93,6 +233,7 @@ def _get_or_refresh_metadata(filepath: str, file_type: str) -> Dict[str, Optiona
             needs_refresh = False
 
     if not needs_refresh:
+        _meta_ttl_put(key, existing)
         return existing
 
     if file_type == "csv":
@@ -113,76 +254,136 @@ def _get_or_refresh_metadata(filepath: str, file_type: str) -> Dict[str, Optiona
     }
 
     with _metadata_lock:
-        _metadata_store[key] = metadata
-        _save_metadata_store(_metadata_store)
-
+        # Copy-on-write: build the successor dict and rebind atomically so
+        # concurrent readers never observe a half-updated store.
+        new_store = dict(_metadata_store)
+        new_store[key] = metadata
+        _metadata_store = new_store
+        _mark_dirty()
+
+    _meta_ttl_put(key, metadata)
     return metadata
 
 def _invalidate_metadata(filepath: str):
     global _metadata_store
     key = _metadata_key(filepath)
+    _meta_ttl_cache.pop(key, None)
     with _metadata_lock:
+        _listing_cache.clear()
         if key in _metadata_store:
-            _metadata_store.pop(key, None)
-            _save_metadata_store(_metadata_store)
+            new_store = dict(_metadata_store)
+            new_store.pop(key, None)
+            _metadata_store = new_store
+            _mark_dirty()
+
+# Listing suffix filters, both common casings precomputed
+_CSV_SUFFIXES = ('.csv', '.CSV')
+_PARQUET_SUFFIXES = ('.parquet', '.PARQUET')
+
+# Full listing memoised on the mtimes of the three scanned directories.
+# Every write path that changes a dataset (upload, drop_columns, delete)
+# goes through a rename or unlink, which bumps the directory mtime, so the
+# client-facing ETag below rolls over too; _invalidate_metadata clears the
+# per-file metadata alongside.
+_listing_cache: Dict[Tuple, DatasetList] = {}
+
+def _dir_mtime_ns(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+def _make_etag(*parts) -> str:
+    return hashlib.blake2b(":".join(str(p) for p in parts).encode(), digest_size=8).hexdigest()
+
+def _file_etag(filepath: str) -> str:
+    stat = freshness_stat(filepath)
+    return _make_etag(filepath, stat.st_mtime_ns, stat.st_size)
 
 @router.get("/", response_model=DatasetList)
-async def list_datasets():
+async def list_datasets(request: Request, response: Response):
     """List datasets from data/, data/uploads (CSV) and data/processed (Parquet)"""
-    datasets = []
-
-    # Helper to append a dataset entry safely
-    def append_csv(path_dir: str, filename: str):
-        filepath = os.path.join(path_dir, filename)
-        if not os.path.exists(filepath):
+    cache_key = tuple(_dir_mtime_ns(d) for d in (UPLOADS_DIR, DATA_ROOT, PROCESSED_DIR))
+    etag = _make_etag(*cache_key)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    cached = _listing_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Collect entries first (one cached DirEntry.stat per file), then refresh
+    # metadata concurrently: cold-cache refreshes read whole files, and they
+    # are independent, so wall time drops from the sum to roughly the max.
+    entries = []
+
+    def collect(directory: str, suffixes: Tuple[str, ...], file_type: str):
+        if not os.path.isdir(directory):
             return
-        metadata = _get_or_refresh_metadata(filepath, "csv")
-        datasets.append(DatasetInfo(
-            name=filename,
+        with os.scandir(directory) as it:
+            for entry in it:
+                # tuple-endswith is one C call with no lowercased copy per entry
+                if entry.name.endswith(suffixes) and entry.is_file(follow_symlinks=False):
+                    entries.append((entry.name, entry.path, entry.stat(), file_type))
+
+    collect(UPLOADS_DIR, _CSV_SUFFIXES, "csv")
+    collect(DATA_ROOT, _CSV_SUFFIXES, "csv")
+    collect(PROCESSED_DIR, _PARQUET_SUFFIXES, "parquet")
+
+    semaphore = asyncio.Semaphore(8)  # cap concurrency to avoid disk thrash
+
+    async def build_info(name: str, path: str, stat: os.stat_result, file_type: str) -> DatasetInfo:
+        async with semaphore:
+            metadata = await asyncio.to_thread(_get_or_refresh_metadata, path, file_type, stat)
+        return DatasetInfo(
+            name=name,
             size=metadata.get("size", 0),
             rows=metadata.get("rows", 0),
             columns=metadata.get("columns", 0),
-            upload_date=os.path.getctime(filepath),
-            file_type="csv"
-        ))
-
-    # CSVs in data/uploads
-    uploads_dir = "data/uploads"
-    if os.path.exists(uploads_dir):
-        for filename in os.listdir(uploads_dir):
-            if filename.lower().endswith('.csv'):
-                append_csv(uploads_dir, filename)
-
-    # CSVs in data/ (exclude common subdirs)
-    data_root = "data"
-    exclude_dirs = {"uploads", "processed", "artifacts", "bin", "exports"}
-    if os.path.exists(data_root):
-        for filename in os.listdir(data_root):
-            candidate_path = os.path.join(data_root, filename)
-            if os.path.isdir(candidate_path) and filename in exclude_dirs:
+            upload_date=stat.st_ctime,
+            file_type=file_type
+        )
+
+    datasets = list(await asyncio.gather(*(build_info(*entry) for entry in entries)))
+
+    result = DatasetList(datasets=datasets)
+    _listing_cache.clear()
+    _listing_cache[cache_key] = result
+    return result
+
+@router.get("/stream")
+async def stream_datasets():
+    """Stream the dataset listing as NDJSON, one line per file as it is processed.
+
+    Keeps peak memory at one entry and lets clients render incrementally;
+    the array-shaped listing above stays for callers that want it whole.
+    (Declared before /{dataset_name} so "stream" is not captured as a name.)
+    """
+    async def generate():
+        for directory, suffixes, file_type in (
+            (UPLOADS_DIR, _CSV_SUFFIXES, "csv"),
+            (DATA_ROOT, _CSV_SUFFIXES, "csv"),
+            (PROCESSED_DIR, _PARQUET_SUFFIXES, "parquet"),
+        ):
+            if not os.path.isdir(directory):
                 continue
-            if filename.lower().endswith('.csv'):
-                append_csv(data_root, filename)
-
-    # Parquet in data/processed
-    processed_dir = "data/processed"
-    if os.path.exists(processed_dir):
-        for filename in os.listdir(processed_dir):
-            if filename.lower().endswith('.parquet'):
-                filepath = os.path.join(processed_dir, filename)
-                if not os.path.exists(filepath):
-                    continue
-                metadata = _get_or_refresh_metadata(filepath, "parquet")
-                datasets.append(DatasetInfo(
-                    name=filename,
-                    size=metadata.get("size", 0),
-                    rows=metadata.get("rows", 0),
-                    columns=metadata.get("columns", 0),
-                    upload_date=os.path.getctime(filepath),
-                    file_type="parquet"
-                ))
-
-    return DatasetList(datasets=datasets)
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if not (entry.name.endswith(suffixes) and entry.is_file(follow_symlinks=False)):
+                        continue
+                    stat = entry.stat()
+                    metadata = await asyncio.to_thread(_get_or_refresh_metadata, entry.path, file_type, stat)
+                    yield json.dumps({
+                        "name": entry.name,
+                        "size": metadata.get("size", 0),
+                        "rows": metadata.get("rows", 0),
+                        "columns": metadata.get("columns", 0),
+                        "upload_date": stat.st_ctime,
+                        "file_type": file_type
+                    }) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 @router.post("/upload")
 async def upload_dataset(file: UploadFile = File(...), separator: str = ","):
@@ -193,21 +394,33 @@ async def upload_dataset(file: UploadFile = File(...), separator: str = ","):
     # Create uploads directory if it doesn't exist
     os.makedirs("data/uploads", exist_ok=True)
     
-    # Save file
+    # Save file (chunked copy keeps peak memory constant for large uploads).
+    # Written to a .tmp then renamed: an in-place overwrite of an existing
+    # name would not bump the directory mtime, so revalidating clients
+    # would keep getting 304 with pre-upload metadata; the rename does.
     filepath = f"data/uploads/{file.filename}"
-    with open(filepath, "wb") as buffer:
-        content = await file.read()
-        buffer.write(content)
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, "wb") as buffer:
+        shutil.copyfileobj(file.file, buffer, length=1024 * 1024)
+    os.replace(tmp_path, filepath)
     
-    # Validate CSV with specified separator
+    # Validate CSV with specified separator: parsing just the first batch
+    # with pyarrow's streaming reader catches header/tokenization errors
+    # without loading the whole file the way pd.read_csv did
     try:
-        df = pd.read_csv(filepath, sep=separator)
-        _get_or_refresh_metadata(filepath, "csv")
+        with pacsv.open_csv(filepath, parse_options=pacsv.ParseOptions(delimiter=separator)) as reader:
+            column_names = reader.schema.names
+            try:
+                reader.read_next_batch()
+            except StopIteration:
+                pass  # header-only file is still a valid upload
+        _invalidate_metadata(filepath)  # re-uploads must not serve stale cached metadata
+        metadata = _get_or_refresh_metadata(filepath, "csv")
         return {
             "message": "Dataset uploaded successfully",
             "filename": file.filename,
-            "rows": len(df),
-            "columns": len(df.columns),
+            "rows": metadata.get("rows", 0),
+            "columns": len(column_names),
             "separator": separator
         }
     except Exception as e:
@@ -215,46 +428,53 @@ async def upload_dataset(file: UploadFile = File(...), separator: str = ","):
         raise HTTPException(status_code=400, detail=f"Invalid CSV file with separator '{separator}': {str(e)}")
 
 @router.get("/{dataset_name}")
-async def get_dataset_info(dataset_name: str, separator: str = ","):
+async def get_dataset_info(dataset_name: str, request: Request, response: Response, separator: str = ","):
     """Get information about a specific dataset (CSV in data/ or uploads, or Parquet in processed)"""
-    # Check if it's a parquet file in processed directory
-    if dataset_name.endswith('.parquet'):
-        filepath = f"data/processed/{dataset_name}"
-        if not os.path.exists(filepath):
-            raise HTTPException(status_code=404, detail="Dataset not found")
-        
+    resolved = resolve_dataset(dataset_name)
+    if resolved is None:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    filepath, kind = resolved
+
+    etag = _file_etag(filepath)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    if kind == "parquet":
         try:
-            df = pd.read_parquet(filepath)
+            # Footer metadata plus the first batch: never load the whole file
+            parquet_file = pq.ParquetFile(filepath)
+            schema = parquet_file.schema_arrow
+            batch = next(parquet_file.iter_batches(batch_size=5), None)
             return {
                 "name": dataset_name,
-                "rows": len(df),
-                "columns": len(df.columns),
-                "column_names": df.columns.tolist(),
-                "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
-                "sample_data": df.head().fillna('').to_dict('records'),
+                "rows": parquet_file.metadata.num_rows,
+                "columns": parquet_file.metadata.num_columns,
+                "column_names": schema.names,
+                "dtypes": {name: str(dtype) for name, dtype in zip(schema.names, schema.types)},
+                "sample_data": batch_records(batch, 5),
                 "file_type": "parquet"
             }
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error reading parquet dataset: {str(e)}")
-    
-    # Check CSV file in uploads directory, then in data/
-    filepath = f"data/uploads/{dataset_name}"
-    if not os.path.exists(filepath):
-        alt_path = f"data/{dataset_name}"
-        if os.path.exists(alt_path):
-            filepath = alt_path
-        else:
-            raise HTTPException(status_code=404, detail="Dataset not found")
-    
+
     try:
-        df = pd.read_csv(filepath, sep=separator)
+        # First streamed batch only: schema and a 5-row sample come from the
+        # head of the file, the row total from the cached metadata store
+        metadata = _get_or_refresh_metadata(filepath, "csv")
+        with pacsv.open_csv(filepath, parse_options=pacsv.ParseOptions(delimiter=separator)) as reader:
+            schema = reader.schema
+            try:
+                batch = reader.read_next_batch()
+            except StopIteration:
+                batch = None
         return {
             "name": dataset_name,
-            "rows": len(df),
-            "columns": len(df.columns),
-            "column_names": df.columns.tolist(),
-            "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
-            "sample_data": df.head().fillna('').to_dict('records'),
+            "rows": metadata.get("rows", 0),
+            "columns": len(schema.names),
+            "column_names": schema.names,
+            "dtypes": {name: str(dtype) for name, dtype in zip(schema.names, schema.types)},
+            "sample_data": batch_records(batch, 5),
             "separator": separator,
             "file_type": "csv"
         }
@@ -264,65 +484,64 @@ async def get_dataset_info(dataset_name: str, separator: str = ","):
 @router.get("/{dataset_name}/download")
 async def download_dataset(dataset_name: str):
     """Download a dataset file (CSV from data/ or uploads, Parquet from processed)"""
-    # Parquet in processed
-    if dataset_name.endswith('.parquet'):
-        parquet_path = f"data/processed/{dataset_name}"
-        if not os.path.exists(parquet_path):
-            raise HTTPException(status_code=404, detail="Dataset not found")
-        return FileResponse(
-            path=parquet_path,
-            filename=dataset_name,
-            media_type='application/octet-stream'
-        )
-
-    # CSV in uploads or data/
-    filepath = f"data/uploads/{dataset_name}"
-    if not os.path.exists(filepath):
-        alt_path = f"data/{dataset_name}"
-        if os.path.exists(alt_path):
-            filepath = alt_path
-        else:
-            raise HTTPException(status_code=404, detail="Dataset not found")
+    resolved = resolve_dataset(dataset_name)
+    if resolved is None:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    filepath, kind = resolved
+    # Passing stat_result lets Starlette skip its own stat and use the
+    # server's zero-copy sendfile path; Accept-Ranges advertises resumable
+    # (and Range-parallelizable) downloads. The attachment name comes from
+    # the resolved file, not the requested name: the cascade may serve the
+    # processed parquet for a CSV name, and the extension must match the
+    # bytes sent.
     return FileResponse(
         path=filepath,
-        filename=dataset_name,
-        media_type='text/csv'
+        filename=os.path.basename(filepath),
+        media_type='application/octet-stream' if kind == "parquet" else 'text/csv',
+        stat_result=os.stat(filepath),
+        # identity/no-transform keeps the gzip middleware (and proxies) from
+        # recompressing already-compressed dataset bytes
+        headers={"Accept-Ranges": "bytes", "Content-Encoding": "identity", "Cache-Control": "no-transform"}
     )
 
 @router.get("/{dataset_name}/preview")
-async def preview_dataset(dataset_name: str, limit: int = 10):
+async def preview_dataset(dataset_name: str, request: Request, response: Response, limit: int = 10):
     """Get a preview of the dataset (first N rows) for CSV or Parquet"""
-    # Parquet in processed
-    if dataset_name.endswith('.parquet'):
-        parquet_path = f"data/processed/{dataset_name}"
-        if not os.path.exists(parquet_path):
-            raise HTTPException(status_code=404, detail="Dataset not found")
-        try:
-            df = pd.read_parquet(parquet_path)
-            preview_data = df.head(limit).fillna('').to_dict('records')
+    resolved = resolve_dataset(dataset_name)
+    if resolved is None:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    filepath, kind = resolved
+
+    etag = f"{_file_etag(filepath)}-{limit}"
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    try:
+        if kind == "parquet":
+            # Only the first `limit` rows are decoded; totals come from the footer
+            parquet_file = pq.ParquetFile(filepath)
+            schema = parquet_file.schema_arrow
+            batch = next(parquet_file.iter_batches(batch_size=limit), None)
             return {
-                "preview": preview_data,
-                "total_rows": len(df),
-                "columns": df.columns.tolist()
+                "preview": batch_records(batch, limit),
+                "total_rows": parquet_file.metadata.num_rows,
+                "columns": schema.names
             }
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error reading dataset: {str(e)}")
-
-    # CSV in uploads or data/
-    filepath = f"data/uploads/{dataset_name}"
-    if not os.path.exists(filepath):
-        alt_path = f"data/{dataset_name}"
-        if os.path.exists(alt_path):
-            filepath = alt_path
-        else:
-            raise HTTPException(status_code=404, detail="Dataset not found")
-    try:
-        df = pd.read_csv(filepath)
-        preview_data = df.head(limit).fillna('').to_dict('records')
+        # Decode only the first streamed batch; the detected delimiter and
+        # row total both come from the metadata store
+        metadata = _get_or_refresh_metadata(filepath, "csv")
+        delimiter = metadata.get("detected_separator") or ","
+        with pacsv.open_csv(filepath, parse_options=pacsv.ParseOptions(delimiter=delimiter)) as reader:
+            schema = reader.schema
+            try:
+                batch = reader.read_next_batch()
+            except StopIteration:
+                batch = None
         return {
-            "preview": preview_data,
-            "total_rows": len(df),
-            "columns": df.columns.tolist()
+            "preview": batch_records(batch, limit),
+            "total_rows": metadata.get("rows", 0),
+            "columns": schema.names
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading dataset: {str(e)}")
@@ -334,111 +553,123 @@ async def preview_columns(file: UploadFile = File(...), separator: str = ","):
         raise HTTPException(status_code=400, detail="Only CSV files are supported")
     
     try:
-        # Read the file content
-        content = await file.read()
-        
-        # Create a temporary file to read with pandas
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as temp_file:
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-        
-        try:
-            df = pd.read_csv(temp_file_path, sep=separator)
-            return {
-                "columns": df.columns.tolist(),
-                "rows": len(df),
-                "sample_data": df.head(3).to_dict('records')
-            }
-        finally:
-            # Clean up temporary file
-            os.unlink(temp_file_path)
-            
+        # FastAPI already spools the upload (memory first, disk past a
+        # threshold), so parse it in place instead of copying to a tempfile.
+        # Row estimate first: count newline bytes in 1 MB chunks, then rewind.
+        src = file.file
+        src.readline()  # skip header
+        rows = 0
+        last_chunk = b"\n"
+        while chunk := src.read(1 << 20):
+            rows += chunk.count(b"\n")
+            last_chunk = chunk
+        if not last_chunk.endswith(b"\n"):
+            rows += 1  # final line without a trailing newline
+        src.seek(0)
+
+        with pacsv.open_csv(src, parse_options=pacsv.ParseOptions(delimiter=separator)) as reader:
+            schema = reader.schema
+            try:
+                batch = reader.read_next_batch()
+            except StopIteration:
+                batch = None
+
+        return {
+            "columns": schema.names,
+            "rows": rows,
+            "sample_data": batch_records(batch, 3)
+        }
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error reading CSV file: {str(e)}")
 
 @router.post("/{dataset_name}/drop-columns")
 async def drop_columns(dataset_name: str, columns_to_drop: str = Form(...), separator: str = Form(",")):
     """Drop specified columns from a dataset"""
-    # Resolve dataset location: uploads/, data/, or processed parquet
-    filepath = f"data/uploads/{dataset_name}"
-    if not os.path.exists(filepath):
-        alt_path = f"data/{dataset_name}"
-        if os.path.exists(alt_path):
-            filepath = alt_path
-        else:
-            # Check if it's already a parquet file in processed directory
-            if dataset_name.endswith('.parquet'):
-                parquet_direct = f"data/processed/{dataset_name}"
-                if os.path.exists(parquet_direct):
-                    filepath = parquet_direct
-                else:
-                    raise HTTPException(status_code=404, detail="Dataset not found")
-            else:
-                # Try to find processed parquet version derived from CSV name
-                parquet_name = dataset_name.replace('.csv', '.parquet')
-                parquet_path = f"data/processed/processed_{parquet_name}"
-                if os.path.exists(parquet_path):
-                    filepath = parquet_path
-                else:
-                    raise HTTPException(status_code=404, detail="Dataset not found")
-    
+    resolved = resolve_dataset(dataset_name)
+    if resolved is None:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    filepath, _ = resolved
+
     try:
-        # Read the dataset (CSV or Parquet)
-        if filepath.endswith('.parquet'):
-            df = pd.read_parquet(filepath)
-        else:
-            df = pd.read_csv(filepath, sep=separator)
-        
         # Parse columns to drop
         columns_to_drop_list = [col.strip() for col in columns_to_drop.split(',') if col.strip()]
-        existing_columns = [col for col in columns_to_drop_list if col in df.columns]
-        
-        if not existing_columns:
-            raise HTTPException(status_code=400, detail="No valid columns found to drop")
-        
-        # Drop the columns
-        df_modified = df.drop(columns=existing_columns)
-        
-        # Save the modified dataset (preserve original format)
+        drop_set = set(columns_to_drop_list)
+        tmp_path = filepath + ".tmp"
+
         if filepath.endswith('.parquet'):
-            df_modified.to_parquet(filepath, index=False)
+            # Column projection: dropped columns are never decoded
+            parquet_file = pq.ParquetFile(filepath)
+            names = parquet_file.schema_arrow.names
+            existing_columns = [col for col in columns_to_drop_list if col in names]
+            if not existing_columns:
+                raise HTTPException(status_code=400, detail="No valid columns found to drop")
+            keep = [col for col in names if col not in drop_set]
+            # Copy row group by row group: keeps the original row-group
+            # boundaries and caps peak memory at one projected group
+            projected_schema = pa.schema([parquet_file.schema_arrow.field(col) for col in keep])
+            rows = 0
+            with pq.ParquetWriter(tmp_path, projected_schema, compression="snappy") as writer:
+                for group in range(parquet_file.metadata.num_row_groups):
+                    table = parquet_file.read_row_group(group, columns=keep)
+                    writer.write_table(table)
+                    rows += table.num_rows
+            del parquet_file
+            os.replace(tmp_path, filepath)
             _invalidate_metadata(filepath)
             _get_or_refresh_metadata(filepath, "parquet")
         else:
-            df_modified.to_csv(filepath, index=False, sep=separator)
+            # Stream batches so peak memory is one batch, not the whole file
+            with pacsv.open_csv(filepath, parse_options=pacsv.ParseOptions(delimiter=separator)) as reader:
+                names = reader.schema.names
+                existing_columns = [col for col in columns_to_drop_list if col in names]
+                if not existing_columns:
+                    raise HTTPException(status_code=400, detail="No valid columns found to drop")
+                keep = [col for col in names if col not in drop_set]
+                projected_schema = pa.schema([reader.schema.field(col) for col in keep])
+                rows = 0
+                with pacsv.CSVWriter(tmp_path, projected_schema,
+                                     write_options=pacsv.WriteOptions(delimiter=separator)) as writer:
+                    for batch in reader:
+                        batch = batch.select(keep)
+                        writer.write(batch)
+                        rows += batch.num_rows
+            os.replace(tmp_path, filepath)
             _invalidate_metadata(filepath)
             _get_or_refresh_metadata(filepath, "csv")
-        
+        invalidate_df_cache()
+
         return {
             "message": "Columns dropped successfully",
             "columns_dropped": existing_columns,
-            "remaining_columns": len(df_modified.columns),
-            "rows": len(df_modified)
+            "remaining_columns": len(keep),
+            "rows": rows
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error dropping columns: {str(e)}")
 
 @router.delete("/{dataset_name}")
 async def delete_dataset(dataset_name: str):
     """Delete a dataset (CSV in data/ or uploads, or Parquet in processed)"""
-    # Parquet in processed
+    # Exact-name matches only: the resolve_dataset read-side fallbacks
+    # (derived processed parquet names for a CSV name) must never redirect
+    # a DELETE to a file the client did not name.
     if dataset_name.endswith('.parquet'):
-        parquet_path = f"data/processed/{dataset_name}"
-        if not os.path.exists(parquet_path):
-            raise HTTPException(status_code=404, detail="Dataset not found")
-        os.remove(parquet_path)
-        _invalidate_metadata(parquet_path)
+        candidates = [(f"{PROCESSED_DIR}/{dataset_name}", "parquet")]
+    else:
+        candidates = [
+            (f"{UPLOADS_DIR}/{dataset_name}", "csv"),
+            (f"{DATA_ROOT}/{dataset_name}", "csv"),
+        ]
+    for filepath, kind in candidates:
+        if os.path.exists(filepath):
+            break
+    else:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    os.remove(filepath)
+    _invalidate_metadata(filepath)
+    invalidate_df_cache()
+    if kind == "parquet":
         return {"message": "Processed dataset deleted successfully"}
-
-    # CSV in uploads or data/
-    csv_path = f"data/uploads/{dataset_name}"
-    if not os.path.exists(csv_path):
-        alt_csv = f"data/{dataset_name}"
-        if os.path.exists(alt_csv):
-            csv_path = alt_csv
-        else:
-            raise HTTPException(status_code=404, detail="Dataset not found")
-    os.remove(csv_path)
-    _invalidate_metadata(csv_path)
     return {"message": "Dataset deleted successfully"}
@@ -5,74 +5,64 @@ Exploratory Data Analysis API endpoints
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 from ..schemas import EDAResponse
+import asyncio
 import pandas as pd
 import os
+from .._df_cache import load_df
+from .._paths import resolve_dataset
 from ...services.eda_service import EDAService
 
 router = APIRouter()
 eda_service = EDAService()
 
+# Report filename shape: eda_<dataset>.html
+_REPORT_PREFIX = "eda_"
+_REPORT_SUFFIX = ".html"
+
 @router.post("/generate/{dataset_name}", response_model=EDAResponse)
 async def generate_eda_report(dataset_name: str):
     """Generate EDA report for a dataset"""
     # Resolve dataset location: uploads/, data/, or processed parquet
-    filepath = f"data/uploads/{dataset_name}"
-    if not os.path.exists(filepath):
-        alt_path = f"data/{dataset_name}"
-        if os.path.exists(alt_path):
-            filepath = alt_path
-        else:
-            # Check if it's already a parquet file in processed directory
-            if dataset_name.endswith('.parquet'):
-                parquet_path = f"data/processed/{dataset_name}"
-                if os.path.exists(parquet_path):
-                    filepath = parquet_path
-                else:
-                    raise HTTPException(status_code=404, detail="Dataset not found")
-            else:
-                # Try to find processed parquet version derived from CSV name
-                parquet_name = dataset_name.replace('.csv', '.parquet')
-                parquet_path = f"data/processed/processed_{parquet_name}"
-                if os.path.exists(parquet_path):
-                    filepath = parquet_path
-                else:
-                    raise HTTPException(status_code=404, detail="Dataset not found")
-    
+    resolved = resolve_dataset(dataset_name)
+    if resolved is None:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    filepath, _ = resolved
+
     try:
-        # Load dataset (CSV or Parquet)
-        if filepath.endswith('.parquet'):
-            df = pd.read_parquet(filepath)
-        else:
-            df = pd.read_csv(filepath, low_memory=False)
-        
+        # Multithreaded pyarrow parse, cached across requests for the same
+        # file version, and run off the event loop
+        df = await asyncio.to_thread(load_df, filepath)
+
         # Generate EDA report
         report_path = await eda_service.generate_report(df, dataset_name)
-        
-        # Get summary statistics (convert to JSON-serializable format)
-        summary = {
-            "shape": [int(x) for x in df.shape],
-            "columns": df.columns.tolist(),
-            "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
-            "missing_values": {col: int(count) for col, count in df.isnull().sum().items()},
-            "numeric_summary": {}
-        }
-        
-        # Add numeric summary if numeric columns exist
-        try:
-            numeric_cols = df.select_dtypes(include=['number']).columns
-            if len(numeric_cols) > 0:
-                numeric_summary = df[numeric_cols].describe()
-                summary["numeric_summary"] = {
-                    col: {
-                        stat: float(value) if pd.notna(value) else None 
-                        for stat, value in numeric_summary[col].items()
-                    } 
-                    for col in numeric_summary.columns
-                }
-        except Exception as e:
-            print(f"Warning: Could not generate numeric summary: {e}")
-            summary["numeric_summary"] = {}
-        
+
+        def _summarize():
+            # Whole-column reductions (isnull().sum(), describe()) run as
+            # vectorized kernels; only the small stat tables get boxed
+            summary = {
+                "shape": [int(x) for x in df.shape],
+                "columns": df.columns.tolist(),
+                "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
+                "missing_values": {col: int(count) for col, count in df.isnull().sum().items()},
+                "numeric_summary": {}
+            }
+            try:
+                numeric = df.select_dtypes(include=['number'])
+                if not numeric.empty:
+                    summary["numeric_summary"] = {
+                        col: {
+                            stat: float(value) if pd.notna(value) else None
+                            for stat, value in stats.items()
+                        }
+                        for col, stats in numeric.describe().to_dict().items()
+                    }
+            except Exception as e:
+                print(f"Warning: Could not generate numeric summary: {e}")
+                summary["numeric_summary"] = {}
+            return summary
+
+        summary = await asyncio.to_thread(_summarize)
+
         # Get the URL for the report
         report_filename = os.path.basename(report_path)
         report_url = f"/static/artifacts/{report_filename}"
@@ -96,38 +86,56 @@ async def get_eda_report(dataset_name: str):
     
     return {"report_path": report_path, "url": f"/static/{os.path.basename(report_path)}"}
 
+# Listing memoised on the directory mtime (new/deleted reports bump it)
+_reports_cache = {"mtime_ns": -1, "items": []}
+
 @router.get("/reports")
 async def list_eda_reports():
     """List all available EDA reports"""
     artifacts_dir = "data/artifacts"
-    if not os.path.exists(artifacts_dir):
+    try:
+        dir_mtime_ns = os.stat(artifacts_dir).st_mtime_ns
+    except OSError:
         return {"reports": []}
-    
+
+    if dir_mtime_ns == _reports_cache["mtime_ns"]:
+        return {"reports": _reports_cache["items"]}
+
     reports = []
-    for filename in os.listdir(artifacts_dir):
-        if filename.startswith("eda_") and filename.endswith(".html"):
-            filepath = os.path.join(artifacts_dir, filename)
-            stat = os.stat(filepath)
-            reports.append({
-                "filename": filename,
-                "dataset_name": filename.replace("eda_", "").replace(".html", ""),
-                "size": stat.st_size,
-                "created": stat.st_ctime,
-                "url": f"/static/artifacts/{filename}"
-            })
+    # scandir hands back cached stat data, one syscall per entry instead of two
+    with os.scandir(artifacts_dir) as it:
+        for entry in it:
+            filename = entry.name
+            if filename.startswith(_REPORT_PREFIX) and filename.endswith(_REPORT_SUFFIX):
+                stat = entry.stat()
+                reports.append({
+                    "filename": filename,
+                    "dataset_name": filename[len(_REPORT_PREFIX):-len(_REPORT_SUFFIX)],
+                    "size": stat.st_size,
+                    "created": stat.st_ctime,
+                    "url": f"/static/artifacts/{filename}"
+                })
     
-    return {"reports": sorted(reports, key=lambda x: x["created"], reverse=True)}
+    reports.sort(key=lambda x: x["created"], reverse=True)
+    _reports_cache["mtime_ns"] = dir_mtime_ns
+    _reports_cache["items"] = reports
+    return {"reports": reports}
 
 @router.get("/view/{filename}")
 async def view_eda_report(filename: str):
     """Serve EDA report HTML file directly in browser"""
     filepath = f"data/artifacts/{filename}"
-    if not os.path.exists(filepath):
+    try:
+        stat = os.stat(filepath)  # doubles as the existence check
+    except OSError:
         raise HTTPException(status_code=404, detail="EDA report not found")
-    
+
+    # stat_result lets Starlette skip its own stat and take the zero-copy
+    # sendfile path when the server supports it
     return FileResponse(
         path=filepath,
-        media_type='text/html'
+        media_type='text/html',
+        stat_result=stat
     )
 
 @router.delete("/reports/{filename}")
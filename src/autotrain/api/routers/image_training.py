@@ -1,19 +1,27 @@
 from __future__ import annotations
 
-import io
+import asyncio
 import json
+import os
 import re
 import shutil
+import tempfile
 import threading
 import zipfile
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, HTTPException, Request, UploadFile, File
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ...trainers.image_classification.params import ImageClassificationParams
 from ...trainers.image_regression.params import ImageRegressionParams
 from ...utils import run_training
@@ -27,8 +35,21 @@ ARTIFACT_ROOT = Path("data/artifacts/image_autotrain")
 ARTIFACT_ROOT.mkdir(parents=True, exist_ok=True)
 
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
+# Dot-free variant for the scandir walks: name.rpartition('.') avoids the
+# full path re-parse that Path.suffix does per file
+_IMAGE_EXT_NO_DOT = {ext.lstrip(".") for ext in IMAGE_EXTENSIONS}
 DATASET_META_FILENAME = ".metadata.json"
 
+# Upload cap (default 10 GiB): oversized archives are refused before any
+# bytes are spooled, and again mid-stream if Content-Length lied
+MAX_UPLOAD_BYTES = int(os.getenv("MODULUS_MAX_UPLOAD_BYTES", str(10 << 30)))
+
+# (params class, autotrain task id) per task type, resolved once
+_PARAMS_BY_TASK = {
+    "classification": (ImageClassificationParams, 18),
+    "regression": (ImageRegressionParams, 24),
+}
+
 CLASSIFICATION_MODELS = [
     {"id": "google/vit-base-patch16-224", "label": "ViT Base Patch16 224"},
     {"id": "facebook/convnext-tiny-224", "label": "ConvNeXt Tiny 224"},
@@ -63,28 +84,76 @@ class TrainingRequest(BaseModel):
     seed: int = Field(42, ge=0)
 
 
-image_training_jobs: Dict[str, Dict] = {}
+IMAGE_JOBS_FILE = ARTIFACT_ROOT / "image_training_jobs.json"
 jobs_lock = threading.Lock()
 
 
-def slugify(value: str) -> str:
-    value = value.strip().lower()
-    value = re.sub(r"[^a-z0-9\-]+", "-", value)
-    value = re.sub(r"-+", "-", value)
-    value = value.strip("-")
-    return value or "dataset"
+def _load_jobs() -> Dict[str, Dict]:
+    if IMAGE_JOBS_FILE.exists():
+        try:
+            raw = IMAGE_JOBS_FILE.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if isinstance(data, dict):
+                return data
+        except Exception as e:  # noqa: B902
+            print(f"Warning: Failed to load image training jobs: {e}")
+    return {}
 
 
-def remove_macos_artifacts(path: Path) -> None:
-    for mac_dir in path.glob("**/__MACOSX"):
-        if mac_dir.is_dir():
-            shutil.rmtree(mac_dir, ignore_errors=True)
+def _save_jobs() -> None:
+    try:
+        # Serialize and publish under the lock: savers run concurrently on
+        # the event-loop thread and pool workers, and interleaving on the
+        # shared .tmp can publish a torn file. Saves are rare and small, so
+        # holding the lock across the write is cheaper than that risk.
+        with jobs_lock:
+            if orjson is not None:
+                buf = orjson.dumps(image_training_jobs, option=orjson.OPT_INDENT_2)
+            else:
+                buf = json.dumps(image_training_jobs, indent=2).encode("utf-8")
+            tmp = IMAGE_JOBS_FILE.with_name(IMAGE_JOBS_FILE.name + ".tmp")
+            tmp.write_bytes(buf)
+            os.replace(tmp, IMAGE_JOBS_FILE)
+    except Exception as e:  # noqa: B902
+        print(f"Warning: Failed to persist image training jobs: {e}")
 
 
-def locate_dataset_root(path: Path) -> Path:
-    entries = [p for p in path.iterdir() if not p.name.startswith("__MACOSX")]
-    if len(entries) == 1 and entries[0].is_dir():
-        return locate_dataset_root(entries[0])
+image_training_jobs: Dict[str, Dict] = _load_jobs()
+
+# Bounded worker pool instead of one thread per request: excess jobs queue
+# as "queued" rather than running concurrently and oversubscribing the
+# accelerator. Concurrency is opt-in via MODULUS_TRAIN_CONCURRENCY.
+_TRAINING_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("MODULUS_TRAIN_CONCURRENCY", "1")),
+    thread_name_prefix="img-train",
+)
+# Futures live outside the job records so those stay JSON-serializable
+_job_futures: Dict[str, object] = {}
+
+
+# Compiled once at import: slugify runs on every upload, and precompiled
+# patterns skip the re module's cache probe per call
+_SLUG_NONALNUM = re.compile(r"[^a-z0-9\-]+")
+_SLUG_DASHES = re.compile(r"-+")
+
+
+def slugify(value: str) -> str:
+    value = _SLUG_NONALNUM.sub("-", value.strip().lower())
+    value = _SLUG_DASHES.sub("-", value).strip("-")
+    return value or "dataset"
+
+
+def locate_dataset_root(path: Path, max_depth: int = 16) -> Path:
+    # Iterative with a depth cap: an archive of thousands of nested
+    # single-directory wrappers must not recurse unboundedly. scandir
+    # reuses the d_type from the directory read, so no per-entry stat.
+    for _ in range(max_depth):
+        with os.scandir(path) as it:
+            entries = [e for e in it if not e.name.startswith("__MACOSX")]
+        if len(entries) == 1 and entries[0].is_dir(follow_symlinks=False):
+            path = Path(entries[0].path)
+            continue
+        break
     return path
 
 
@@ -93,29 +162,90 @@ def ensure_train_directory(base_path: Path) -> Path:
     if train_dir.exists():
         return base_path
 
-    subdirs = [p for p in base_path.iterdir() if p.is_dir()]
-    if not subdirs:
+    with os.scandir(base_path) as it:
+        subdir_names = [e.name for e in it if e.is_dir(follow_symlinks=False)]
+    if not subdir_names:
         raise HTTPException(status_code=400, detail="Dataset must contain class folders or a train directory")
 
     train_dir.mkdir()
-    for subdir in subdirs:
-        if subdir == train_dir:
-            continue
-        target = train_dir / subdir.name
-        if target.exists():
-            continue
-        subdir.rename(target)
+    # train/ was created just above, so it is empty: every class folder can
+    # be renamed straight in — one os.rename syscall per class, no
+    # per-target exists() probe and no Path re-resolution
+    base = str(base_path)
+    train_base = str(train_dir)
+    for name in subdir_names:
+        os.rename(os.path.join(base, name), os.path.join(train_base, name))
     return base_path
 
 
+def _summarise_from_members(member_names: List[str]) -> Dict:
+    """Classification summary straight from the zip member paths.
+
+    The archive listing already encodes the class layout, so tallying it
+    while extracting avoids re-walking the freshly written tree. Mirrors
+    what locate_dataset_root + ensure_train_directory do to the paths:
+    singleton wrapper directories are stripped, and without a train/ level
+    every top directory (validation included) becomes a class.
+    """
+    split_names = []
+    for name in member_names:
+        parts = [p for p in name.split("/") if p]
+        if parts:
+            split_names.append((parts, name.endswith("/")))
+
+    for _ in range(16):
+        tops = {parts[0] for parts, _ in split_names}
+        if len(tops) == 1 and all(len(parts) > 1 or is_dir for parts, is_dir in split_names):
+            split_names = [(parts[1:], is_dir) for parts, is_dir in split_names if len(parts) > 1]
+        else:
+            break
+
+    tops = {parts[0] for parts, _ in split_names}
+    has_train = "train" in tops
+    classes = set()
+    image_count = 0
+    for parts, is_dir in split_names:
+        if has_train:
+            if parts[0] != "train" or len(parts) < 2:
+                continue
+            rel = parts[1:]
+        else:
+            rel = parts
+        if len(rel) == 1 and is_dir:
+            classes.add(rel[0])
+        elif len(rel) == 2 and not is_dir and rel[1].rpartition('.')[2].lower() in _IMAGE_EXT_NO_DOT:
+            classes.add(rel[0])
+            image_count += 1
+    return {
+        "classes": sorted(classes),
+        "num_images": image_count,
+        "has_validation": has_train and "validation" in tops,
+    }
+
+
+def _count_images(directory: str) -> int:
+    with os.scandir(directory) as files:
+        return sum(
+            1 for f in files
+            if f.is_file(follow_symlinks=False)
+            and f.name.rpartition('.')[2].lower() in _IMAGE_EXT_NO_DOT
+        )
+
+
 def summarise_classification_dataset(base_path: Path) -> Dict:
     classes_root = base_path / "train"
     has_validation = (base_path / "validation").exists()
-    class_dirs = [d for d in classes_root.iterdir() if d.is_dir()]
-    classes = sorted(d.name for d in class_dirs)
-    image_count = 0
-    for d in class_dirs:
-        image_count += sum(1 for f in d.iterdir() if f.suffix.lower() in IMAGE_EXTENSIONS)
+    with os.scandir(classes_root) as it:
+        class_dirs = [e for e in it if e.is_dir(follow_symlinks=False)]
+    classes = sorted(e.name for e in class_dirs)
+    if class_dirs:
+        # Per-class scans are independent getdents loops; fanning them out
+        # lets the directory reads overlap (threads release the GIL in
+        # syscalls), which matters most on networked filesystems
+        with ThreadPoolExecutor(max_workers=min(32, len(class_dirs))) as ex:
+            image_count = sum(ex.map(_count_images, (e.path for e in class_dirs)))
+    else:
+        image_count = 0
     return {
         "classes": classes,
         "num_images": image_count,
@@ -140,15 +270,22 @@ def summarise_regression_dataset(base_path: Path) -> Dict:
     total_records = 0
     sample_targets: List[Optional[float]] = []
     for meta_path in metadata_paths:
-        with meta_path.open("r", encoding="utf-8") as f:
-            for idx, line in enumerate(f):
-                total_records += 1
-                if idx < 5:
-                    try:
-                        entry = json.loads(line)
-                        sample_targets.append(entry.get("target"))
-                    except json.JSONDecodeError:
-                        continue
+        with meta_path.open("rb") as f:
+            # Decode only the first 5 lines for the sample...
+            for _, line in zip(range(5), f):
+                try:
+                    entry = json.loads(line)
+                    sample_targets.append(entry.get("target"))
+                except json.JSONDecodeError:
+                    continue
+            # ...then count the rest by newline bytes, no per-line decode
+            f.seek(0)
+            last_chunk = b"\n"
+            while chunk := f.read(1 << 20):
+                total_records += chunk.count(b"\n")
+                last_chunk = chunk
+            if not last_chunk.endswith(b"\n"):
+                total_records += 1  # final record without a trailing newline
     return {
         "num_records": total_records,
         "has_validation": has_validation,
@@ -156,9 +293,34 @@ def summarise_regression_dataset(base_path: Path) -> Dict:
     }
 
 
+# Parsed .metadata.json files keyed by mtime: repeat lookups (the UI polls
+# /datasets and every training start re-reads its dataset) skip the
+# open+parse; a rewritten file gets a new mtime and reloads itself.
+_meta_cache: Dict[Path, tuple] = {}
+
+
+def _read_metadata_file(meta_path: Path) -> Dict:
+    st = meta_path.stat()
+    cached = _meta_cache.get(meta_path)
+    if cached is not None and cached[0] == st.st_mtime_ns:
+        return cached[1]
+    with meta_path.open("rb") as f:
+        raw = f.read()
+    metadata = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    _meta_cache[meta_path] = (st.st_mtime_ns, metadata)
+    return metadata
+
+
 def save_dataset_metadata(dataset_dir: Path, metadata: Dict) -> None:
-    with open(dataset_dir / DATASET_META_FILENAME, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, indent=2)
+    # orjson encodes in C straight to bytes; stdlib json is the fallback
+    meta_path = dataset_dir / DATASET_META_FILENAME
+    if orjson is not None:
+        buf = orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(metadata, indent=2).encode("utf-8")
+    with open(meta_path, "wb") as f:
+        f.write(buf)
+    _meta_cache.pop(meta_path, None)
 
 
 def load_dataset_metadata(dataset_name: str) -> Dict:
@@ -166,8 +328,9 @@ def load_dataset_metadata(dataset_name: str) -> Dict:
     meta_path = dataset_dir / DATASET_META_FILENAME
     if not dataset_dir.exists() or not meta_path.exists():
         raise HTTPException(status_code=404, detail="Dataset not found")
-    with meta_path.open("r", encoding="utf-8") as f:
-        metadata = json.load(f)
+    # Copy before annotating: the cached dict must stay pristine, callers
+    # add "path" and pop it again
+    metadata = dict(_read_metadata_file(meta_path))
     metadata["path"] = str(dataset_dir.resolve())
     return metadata
 
@@ -175,26 +338,57 @@ def load_dataset_metadata(dataset_name: str) -> Dict:
 def list_all_datasets() -> List[Dict]:
     datasets = []
     for meta_path in DATASET_ROOT.glob(f"*/{DATASET_META_FILENAME}"):
-        with meta_path.open("r", encoding="utf-8") as f:
-            meta = json.load(f)
+        meta = dict(_read_metadata_file(meta_path))
         meta["path"] = str(meta_path.parent.resolve())
         datasets.append(meta)
     datasets.sort(key=lambda d: d.get("created_at", ""), reverse=True)
     return datasets
 
 
+def _last_eval_entry(buf: bytes) -> Optional[Dict]:
+    # log_history entries are flat objects, so the enclosing braces around
+    # the last "eval_" key delimit the last eval log
+    idx = buf.rfind(b'"eval_')
+    while idx != -1:
+        start = buf.rfind(b"{", 0, idx)
+        end = buf.find(b"}", idx)
+        if start != -1 and end != -1:
+            try:
+                chunk = buf[start:end + 1]
+                candidate = orjson.loads(chunk) if orjson is not None else json.loads(chunk)
+                if isinstance(candidate, dict):
+                    return candidate
+            except Exception:  # noqa: B902
+                pass
+        idx = buf.rfind(b'"eval_', 0, idx)
+    return None
+
+
 def parse_trainer_metrics(project_dir: Path) -> Dict:
     metrics_path = project_dir / "trainer_state.json"
     if not metrics_path.exists():
         return {}
     try:
-        with metrics_path.open("r", encoding="utf-8") as f:
-            state = json.load(f)
-        log_history = state.get("log_history", [])
-        eval_logs = [log for log in log_history if any(k.startswith("eval_") for k in log.keys())]
-        if not eval_logs:
-            return {}
-        latest = eval_logs[-1]
+        # Tail-first: the latest eval log sits at the end of log_history,
+        # so a 64 KB read from EOF usually finds it without parsing the
+        # whole state file (which grows with every training step)
+        with metrics_path.open("rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - 65536))
+            tail = f.read()
+        latest = _last_eval_entry(tail)
+        if latest is None:
+            if size <= 65536:
+                return {}
+            # eval logs may predate the tail window; full parse as a fallback
+            raw = metrics_path.read_bytes()
+            state = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            log_history = state.get("log_history", [])
+            eval_logs = [log for log in log_history if any(k.startswith("eval_") for k in log.keys())]
+            if not eval_logs:
+                return {}
+            latest = eval_logs[-1]
         return {k: v for k, v in latest.items() if k.startswith("eval_") or k in {"epoch"}}
     except Exception:  # noqa: B902
         return {}
@@ -202,11 +396,16 @@ def parse_trainer_metrics(project_dir: Path) -> Dict:
 
 def training_worker(job_id: str, request: TrainingRequest):
     try:
+        # One timestamp per transition, shared across the fields it stamps
+        # (datetime.utcnow is also deprecated since 3.12)
+        now_iso = datetime.now(timezone.utc).isoformat()
         with jobs_lock:
             job = image_training_jobs.get(job_id)
             if job:
                 job["status"] = "running"
-                job["started_at"] = datetime.utcnow().isoformat()
+                job["started_at"] = now_iso
+                job["updated_at"] = now_iso
+        _save_jobs()
 
         dataset_meta = load_dataset_metadata(request.dataset_name)
         dataset_path = Path(dataset_meta["path"])
@@ -241,48 +440,59 @@ def training_worker(job_id: str, request: TrainingRequest):
         else:
             params_kwargs["valid_split"] = None
 
-        if request.task_type == "classification":
-            params_class = ImageClassificationParams
-            task_id = 18
-        else:
-            params_class = ImageRegressionParams
-            task_id = 24
-
+        params_class, task_id = _PARAMS_BY_TASK[request.task_type]
         params = params_class(**params_kwargs)
 
-        run_training(params.model_dump_json(indent=0), task_id=task_id, local=True, wait=True)
+        # run_training accepts validated params objects directly; no JSON
+        # serialize/parse/revalidate round-trip per job
+        run_training(params, task_id=task_id, local=True, wait=True)
 
         dest_dir = ARTIFACT_ROOT / request.project_name
         if dest_dir.exists():
-            shutil.rmtree(dest_dir, ignore_errors=True)
+            # Swing stale artifacts aside with one atomic rename and delete
+            # them in the background; rmtree on a big checkpoint tree would
+            # otherwise sit on the publish path
+            doomed = dest_dir.with_name(f"{dest_dir.name}.old-{uuid4().hex[:6]}")
+            os.rename(dest_dir, doomed)
+            threading.Thread(
+                target=shutil.rmtree, args=(doomed,), kwargs={"ignore_errors": True}, daemon=True
+            ).start()
         if project_dir.exists():
             dest_dir.parent.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(project_dir), dest_dir)
+            try:
+                # Same filesystem: one O(1) atomic rename instead of an
+                # O(files) copy+delete
+                os.rename(project_dir, dest_dir)
+            except OSError:
+                # Cross-device move (EXDEV): fall back to copying
+                shutil.move(str(project_dir), dest_dir)
         metrics = parse_trainer_metrics(dest_dir)
 
+        now_iso = datetime.now(timezone.utc).isoformat()
         with jobs_lock:
             job = image_training_jobs.get(job_id)
             if job:
                 job["status"] = "completed"
-                job["finished_at"] = datetime.utcnow().isoformat()
+                job["finished_at"] = now_iso
+                job["updated_at"] = now_iso
                 job["metrics"] = metrics
                 job["output_dir"] = str(dest_dir)
     except Exception as e:  # noqa: B902
+        now_iso = datetime.now(timezone.utc).isoformat()
         with jobs_lock:
             job = image_training_jobs.get(job_id)
             if job:
                 job["status"] = "failed"
-                job["finished_at"] = datetime.utcnow().isoformat()
+                job["finished_at"] = now_iso
+                job["updated_at"] = now_iso
                 job["error"] = str(e)
     finally:
-        with jobs_lock:
-            job = image_training_jobs.get(job_id)
-            if job:
-                job["updated_at"] = datetime.utcnow().isoformat()
+        _save_jobs()
 
 
 @router.post("/upload-dataset")
 async def upload_image_dataset(
+    request: Request,
     file: UploadFile = File(...),
     task_type: str = File(...),
 ):
@@ -292,20 +502,55 @@ async def upload_image_dataset(
     if not file.filename.endswith(".zip"):
         raise HTTPException(status_code=400, detail="Only .zip archives are supported")
 
-    raw_bytes = await file.read()
-    if len(raw_bytes) == 0:
-        raise HTTPException(status_code=400, detail="Uploaded file is empty")
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="Archive too large")
+
+    # Stream the archive to a spill file in 1 MB chunks: peak memory stays
+    # O(chunk) instead of O(archive size), and disk writes overlap the
+    # network receive. The spill file is removed once extraction is done.
+    tmp = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
+    tmp_path = Path(tmp.name)
+    received = 0
+    try:
+        with tmp:
+            while chunk := await file.read(1 << 20):
+                received += len(chunk)
+                if received > MAX_UPLOAD_BYTES:
+                    raise HTTPException(status_code=413, detail="Archive too large")
+                tmp.write(chunk)
+        if received == 0:
+            raise HTTPException(status_code=400, detail="Uploaded file is empty")
+
+        # Extraction + summarisation are blocking (zip inflate, directory
+        # walks); run them in a worker thread so parallel uploads overlap
+        # instead of serializing on the event loop
+        return await asyncio.to_thread(_ingest_archive, tmp_path, file.filename, task_type)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
 
-    slug = slugify(Path(file.filename).stem)
+def _ingest_archive(tmp_path: Path, filename: str, task_type: str) -> Dict:
+    slug = slugify(Path(filename).stem)
     dataset_name = f"{slug}-{uuid4().hex[:6]}"
     dataset_dir = DATASET_ROOT / dataset_name
     dataset_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        with zipfile.ZipFile(io.BytesIO(raw_bytes)) as archive:
-            archive.extractall(dataset_dir)
-
-        remove_macos_artifacts(dataset_dir)
+        members = []
+        with zipfile.ZipFile(tmp_path) as archive:
+            # Prune macOS junk (__MACOSX trees, .DS_Store) at extract time;
+            # extracting everything and rglobbing it away afterwards walked
+            # the freshly written tree a second time. Member names are
+            # validated up front and kept for the member-path summary below.
+            for info in archive.infolist():
+                parts = info.filename.split("/")
+                if "__MACOSX" in parts or parts[-1] == ".DS_Store":
+                    continue
+                if info.filename.startswith(("/", "\\")) or ".." in parts:
+                    raise HTTPException(status_code=400, detail="Archive contains unsafe member paths")
+                archive.extract(info, dataset_dir)
+                members.append(info.filename)
 
         extracted_root = locate_dataset_root(dataset_dir)
         if extracted_root != dataset_dir:
@@ -319,14 +564,17 @@ async def upload_image_dataset(
 
         if task_type == "classification":
             ensure_train_directory(dataset_dir)
-            summary = summarise_classification_dataset(dataset_dir)
+            summary = _summarise_from_members(members)
+            if not summary["classes"]:
+                # layouts the member paths can't explain: fall back to the walk
+                summary = summarise_classification_dataset(dataset_dir)
         else:
             summary = summarise_regression_dataset(dataset_dir)
 
         metadata = {
             "name": dataset_name,
             "task_type": task_type,
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
             "path": str(dataset_dir.resolve()),
             **summary,
         }
@@ -334,6 +582,10 @@ async def upload_image_dataset(
         metadata.pop("path", None)
         return {"message": "Dataset uploaded successfully", "dataset": metadata}
     except HTTPException:
+        # The unsafe-member 400 fires mid-extraction; drop the partial tree
+        # like the other failure branches instead of orphaning it
+        if dataset_dir.exists():
+            shutil.rmtree(dataset_dir, ignore_errors=True)
         raise
     except zipfile.BadZipFile as e:
         if dataset_dir.exists():
@@ -371,38 +623,42 @@ async def start_image_training(request: TrainingRequest):
     if request.push_to_hub and (not request.username or not request.token):
         raise HTTPException(status_code=400, detail="username and token are required when push_to_hub is true")
 
-    job_id = f"img_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:6]}"
+    now = datetime.now(timezone.utc)
+    job_id = f"img_{now.strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:6]}"
     job_record = {
         "job_id": job_id,
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": now.isoformat(),
         "status": "queued",
         "task_type": request.task_type,
         "dataset_name": request.dataset_name,
         "project_name": request.project_name,
         "base_model": request.base_model,
-        "params": request.model_dump(exclude_none=True),
+        # token is excluded: the record is persisted to the jobs file and
+        # must never write credentials to disk
+        "params": request.model_dump(exclude_none=True, exclude={"token"}),
     }
     with jobs_lock:
         image_training_jobs[job_id] = job_record
+    _save_jobs()
 
-    worker = threading.Thread(target=training_worker, args=(job_id, request), daemon=True)
-    worker.start()
+    _job_futures[job_id] = _TRAINING_POOL.submit(training_worker, job_id, request)
 
     return {"job_id": job_id, "status": "queued"}
 
 
 @router.get("/jobs")
 async def list_image_training_jobs():
-    with jobs_lock:
-        jobs = list(image_training_jobs.values())
+    # Lock-free read: dict.values() snapshotting is atomic under the GIL,
+    # so polling clients no longer contend with worker status updates.
+    # Mutations keep jobs_lock since they touch several fields at once.
+    jobs = list(image_training_jobs.values())
     jobs.sort(key=lambda job: job.get("created_at", ""), reverse=True)
     return {"jobs": jobs}
 
 
 @router.get("/jobs/{job_id}")
 async def get_image_training_job(job_id: str):
-    with jobs_lock:
-        job = image_training_jobs.get(job_id)
+    job = image_training_jobs.get(job_id)  # atomic under the GIL, no lock needed
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return job
@@ -2,14 +2,28 @@
 Data Preprocessing and Cleaning API endpoints
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, Response
 from fastapi.responses import FileResponse
 from ..schemas import PreprocessingRequest, PreprocessingResponse, PreprocessingResult, ManualPreviewResponse, ManualApplyRequest
+import asyncio
+import json
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import os
+import time
 import uuid
+from collections import Counter
 from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from typing import Dict
+from .._df_cache import load_df
+from .._paths import resolve_dataset
 from ...services.preprocessing_service import PreprocessingService
 from ...services.ai_analysis_service import AIAnalysisService
 
@@ -17,42 +31,174 @@ router = APIRouter()
 preprocessing_service = PreprocessingService()
 ai_service = AIAnalysisService()
 
-# In-memory storage for preprocessing jobs (in production, use Redis or database)
-preprocessing_jobs = {}
+ARTIFACTS_DIR = "data/artifacts"
+PROCESSED_DIR = "data/processed"
+# Report filename shape: preprocessing_report_<job_id>.html
+_REPORT_PREFIX = "preprocessing_report_"
+_REPORT_SUFFIX = ".html"
+
+# Jobs are kept in memory for fast reads and mirrored to a JSON file under
+# data/artifacts (same pattern as the training routers): a restart keeps the
+# job history, and the file is written atomically via tmp + os.replace.
+PREPROCESSING_JOBS_FILE = f"{ARTIFACTS_DIR}/preprocessing_jobs.json"
+
+def _load_jobs() -> dict:
+    try:
+        with open(PREPROCESSING_JOBS_FILE, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if isinstance(data, dict):
+            return data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: Failed to load preprocessing jobs: {e}")
+    return {}
+
+# Bumped on every persisted mutation; doubles as the ETag for the polled
+# listing endpoints so unchanged state answers 304 with no serialization.
+# Seeded with the process start time: a counter starting at 0 would repeat
+# values after a restart and hand clients from the previous process a
+# false 304 against their stale cached body.
+_jobs_version = time.time_ns()
+
+def _save_jobs() -> None:
+    global _jobs_version
+    _jobs_version += 1
+    try:
+        os.makedirs(os.path.dirname(PREPROCESSING_JOBS_FILE), exist_ok=True)
+        if orjson is not None:
+            buf = orjson.dumps(preprocessing_jobs, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            buf = json.dumps(preprocessing_jobs, indent=2, default=str).encode("utf-8")
+        tmp = PREPROCESSING_JOBS_FILE + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(buf)
+        os.replace(tmp, PREPROCESSING_JOBS_FILE)
+    except Exception as e:
+        print(f"Warning: Failed to persist preprocessing jobs: {e}")
+
+preprocessing_jobs = _load_jobs()
+
+# Cap on retained job records: a long-lived service otherwise accumulates
+# every result dict forever. Jobs are inserted at creation and dicts keep
+# insertion order, so trimming from the front drops the oldest records.
+_MAX_JOBS = int(os.getenv("MODULUS_MAX_PREPROCESSING_JOBS", "10000"))
+
+def _now_iso() -> str:
+    # One formatted timestamp per job transition. Kept as an ISO string:
+    # the created_at/completed_at fields go out verbatim on the polled
+    # /jobs listing, so storing time_ns ints would just move the
+    # formatting cost from one write to every read.
+    return datetime.now().isoformat()
+
+def _evict_old_jobs() -> None:
+    while len(preprocessing_jobs) > _MAX_JOBS:
+        del preprocessing_jobs[next(iter(preprocessing_jobs))]
+
+# job_id -> report path. Built lazily with a single directory scan the
+# first time a lookup misses the in-memory jobs (i.e. after a restart);
+# afterwards fallback lookups are O(1) instead of an O(N) listdir scan.
+_report_index = {}
+_report_index_built = False
+
+def _build_report_index() -> None:
+    global _report_index_built
+    try:
+        with os.scandir(ARTIFACTS_DIR) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(_REPORT_PREFIX) and name.endswith(_REPORT_SUFFIX):
+                    _report_index[name[len(_REPORT_PREFIX):-len(_REPORT_SUFFIX)]] = entry.path
+    except OSError:
+        pass
+    _report_index_built = True
+
+def _numeric_stats(arr) -> dict:
+    """describe()-shaped stats for a numeric Arrow array, computed with Arrow kernels."""
+    non_null = len(arr) - arr.null_count
+    if non_null == 0:
+        return {"count": 0.0, "mean": None, "std": None, "min": None,
+                "25%": None, "50%": None, "75%": None, "max": None}
+
+    def _as_float(v):
+        return float(v) if v is not None else None
+
+    min_max = pc.min_max(arr)
+    quantiles = pc.quantile(arr, q=[0.25, 0.5, 0.75]).to_pylist()
+    std = pc.stddev(arr, ddof=1).as_py() if non_null > 1 else None
+    return {
+        "count": float(non_null),
+        "mean": _as_float(pc.mean(arr).as_py()),
+        "std": _as_float(std),
+        "min": _as_float(min_max["min"].as_py()),
+        "25%": _as_float(quantiles[0]),
+        "50%": _as_float(quantiles[1]),
+        "75%": _as_float(quantiles[2]),
+        "max": _as_float(min_max["max"].as_py()),
+    }
+
+def _parquet_manual_preview(dataset_name: str, filepath: str, target_column: str) -> dict:
+    """Column summaries straight from a Parquet file, one column in memory at a time.
+
+    The footer metadata gives the shape for free; each column is then decoded
+    on its own and reduced with Arrow compute kernels, so a wide file never
+    has to be materialized as a full DataFrame just to report per-column stats.
+    """
+    parquet_file = pq.ParquetFile(filepath)
+    schema = parquet_file.schema_arrow
+    # Row count is free from the footer; per-column reads below only decode
+    num_rows = parquet_file.metadata.num_rows
+
+    columns = []
+    for field in schema:
+        arr = parquet_file.read(columns=[field.name]).column(0)
+        numeric = pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+        zeros = 0
+        if numeric:
+            zeros = int(pc.sum(pc.equal(arr, 0)).as_py() or 0)
+        non_null_values = arr.drop_null()
+        sample = non_null_values.slice(0, 5).to_pylist()
+        columns.append({
+            "name": field.name,
+            "dtype": str(field.type),
+            "non_null": num_rows - arr.null_count,
+            "nulls": arr.null_count,
+            "unique": int(pc.count_distinct(non_null_values).as_py() or 0),
+            "zeros": zeros,
+            "sample_values": [float(v) for v in sample] if numeric else [str(v) for v in sample],
+            "stats": _numeric_stats(arr) if numeric else {},
+        })
+
+    class_balance = None
+    if target_column and target_column in schema.names:
+        # Streamed batch-by-batch: memory stays O(distinct labels), not
+        # O(rows), even when the target column itself is huge
+        counts = Counter()
+        null_count = 0
+        for batch in parquet_file.iter_batches(batch_size=65536, columns=[target_column]):
+            arr = batch.column(0)
+            null_count += arr.null_count
+            for entry in pc.value_counts(arr.drop_null()).to_pylist():
+                counts[str(entry["values"])] += int(entry["counts"])
+        class_balance = dict(counts)
+        if null_count:
+            class_balance[str(None)] = null_count
+
+    return {
+        "dataset_name": dataset_name,
+        "columns": columns,
+        "target_column": target_column,
+        "class_balance": class_balance
+    }
 
 @router.post("/start", response_model=PreprocessingResponse)
 async def start_preprocessing(request: PreprocessingRequest, background_tasks: BackgroundTasks):
     """Start a new data preprocessing job"""
     # Resolve dataset location: uploads/, data/, or processed parquet
-    filepath = f"data/uploads/{request.dataset_name}"
-    if not os.path.exists(filepath):
-        alt_path = f"data/{request.dataset_name}"
-        if os.path.exists(alt_path):
-            filepath = alt_path
-        else:
-            # If a parquet name is provided directly, check in processed
-            if request.dataset_name.endswith('.parquet'):
-                parquet_direct = f"data/processed/{request.dataset_name}"
-                if os.path.exists(parquet_direct):
-                    filepath = parquet_direct
-                else:
-                    raise HTTPException(status_code=404, detail="Dataset not found")
-            else:
-                # Try to find processed parquet version (same name, different extension)
-                base_name = request.dataset_name
-                if base_name.endswith('.csv'):
-                    base_name = base_name[:-4]
-                # Try new naming convention first (same name, different extension)
-                parquet_path = f"data/processed/{base_name}.parquet"
-                # Fallback to old naming convention for backward compatibility
-                if not os.path.exists(parquet_path):
-                    old_parquet_path = f"data/processed/processed_{base_name}.parquet"
-                    if os.path.exists(old_parquet_path):
-                        parquet_path = old_parquet_path
-                    else:
-                        raise HTTPException(status_code=404, detail="Dataset not found")
-                filepath = parquet_path
-    
+    if resolve_dataset(request.dataset_name) is None:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+
     job_id = str(uuid.uuid4())
     
     # Store job info
@@ -62,9 +208,11 @@ async def start_preprocessing(request: PreprocessingRequest, background_tasks: B
         "dataset_name": request.dataset_name,
         "preprocessing_options": request.preprocessing_options,
         "ai_analysis": request.ai_analysis,
-        "created_at": datetime.now().isoformat()
+        "created_at": _now_iso()
     }
-    
+    _evict_old_jobs()
+    _save_jobs()
+
     # Start preprocessing in background
     background_tasks.add_task(
         run_preprocessing,
@@ -94,94 +242,80 @@ async def get_preprocessing_status(job_id: str):
         raise HTTPException(status_code=500, detail=f"Failed to get job status: {str(e)}")
 
 @router.get("/jobs")
-async def list_preprocessing_jobs():
+async def list_preprocessing_jobs(request: Request, response: Response):
     """List all preprocessing jobs"""
-    # Convert numpy types to native Python types for JSON serialization
-    jobs_list = []
-    for job in preprocessing_jobs.values():
-        job_copy = job.copy()
-        # Convert result dict if present
-        if "result" in job_copy and job_copy["result"]:
-            result = job_copy["result"]
-            if isinstance(result, dict):
-                # Ensure all numpy types are converted
-                if "original_shape" in result and result["original_shape"]:
-                    result["original_shape"] = tuple(int(x) for x in result["original_shape"]) if isinstance(result["original_shape"], tuple) else result["original_shape"]
-                if "final_shape" in result and result["final_shape"]:
-                    result["final_shape"] = tuple(int(x) for x in result["final_shape"]) if isinstance(result["final_shape"], tuple) else result["final_shape"]
-        jobs_list.append(job_copy)
-    return {"jobs": jobs_list}
+    etag = f'"{_jobs_version}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    # Shapes are normalized once when a job completes, so the frequently
+    # polled listing is a plain dict-values dump with no per-call copying.
+    # (The old shallow job.copy() shared the inner result dict anyway, so
+    # its in-handler coercion mutated live job state; writers now coerce
+    # before storing and readers never touch the records.)
+    return {"jobs": list(preprocessing_jobs.values())}
 
 @router.get("/manual/preview/{dataset_name}", response_model=ManualPreviewResponse)
 async def manual_preview(dataset_name: str, target_column: str = None, separator: str = ","):
     """Return column summaries and optional class balance for manual preprocessing UI"""
     # Resolve dataset path (CSV or Parquet)
-    filepath = f"data/uploads/{dataset_name}"
-    if not os.path.exists(filepath):
-        alt_path = f"data/{dataset_name}"
-        if os.path.exists(alt_path):
-            filepath = alt_path
-        else:
-            if dataset_name.endswith('.parquet'):
-                parquet_direct = f"data/processed/{dataset_name}"
-                if os.path.exists(parquet_direct):
-                    filepath = parquet_direct
-                else:
-                    raise HTTPException(status_code=404, detail="Dataset not found")
-            else:
-                # Try to find processed parquet version (same name, different extension)
-                base_name = dataset_name
-                if base_name.endswith('.csv'):
-                    base_name = base_name[:-4]
-                # Try new naming convention first (same name, different extension)
-                parquet_path = f"data/processed/{base_name}.parquet"
-                # Fallback to old naming convention for backward compatibility
-                if not os.path.exists(parquet_path):
-                    old_parquet_path = f"data/processed/processed_{base_name}.parquet"
-                    if os.path.exists(old_parquet_path):
-                        parquet_path = old_parquet_path
-                    else:
-                        raise HTTPException(status_code=404, detail="Dataset not found")
-                filepath = parquet_path
-
-    # Load dataset
+    resolved = resolve_dataset(dataset_name)
+    if resolved is None:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    filepath, _ = resolved
+
+    # Both branches parse and summarize the whole file; that runs on a
+    # worker thread so the event loop stays responsive, matching the other
+    # full-file load_df call sites
     if filepath.endswith('.parquet'):
-        df = pd.read_parquet(filepath)
-    else:
-        df = pd.read_csv(filepath, sep=separator, low_memory=False)
+        # Parquet never goes through pandas here: the summaries come
+        # straight from Arrow, one column decoded at a time
+        return await asyncio.to_thread(_parquet_manual_preview, dataset_name, filepath, target_column)
+    return await asyncio.to_thread(_csv_manual_preview, dataset_name, filepath, separator, target_column)
+
+def _csv_manual_preview(dataset_name: str, filepath: str, separator: str, target_column):
+    """Synchronous CSV half of manual_preview, run on a worker thread"""
+    # Multithreaded pyarrow parse, cached across requests for the same file
+    # version (load_df falls back to pandas for ragged/exotic CSVs)
+    df = load_df(filepath, sep=separator)
+
+    # Frame-wide reductions: each statistic is one vectorized pass over the
+    # whole frame instead of a separate full-column pass per column
+    non_null = df.notnull().sum().to_dict()
+    nulls = df.isnull().sum().to_dict()
+    unique = df.nunique(dropna=True).to_dict()
+    numeric_df = df.select_dtypes(include='number')
+    zeros = numeric_df.eq(0).sum().to_dict()
+    desc = numeric_df.describe().to_dict() if not numeric_df.empty else {}
 
     columns = []
     for col in df.columns:
         series = df[col]
-        # Calculate zeros for numeric columns
-        zeros = 0
-        if pd.api.types.is_numeric_dtype(series):
-            zeros = int((series == 0).sum())
-        
-        summary = {
+        is_numeric = col in desc
+        # dropna + head once, not once per sample value
+        sample = series.dropna().head(5).tolist()
+        columns.append({
             "name": col,
             "dtype": str(series.dtype),
-            "non_null": int(series.notnull().sum()),
-            "nulls": int(series.isnull().sum()),
-            "unique": int(series.nunique(dropna=True)),
-            "zeros": zeros,
-            "sample_values": [
-                float(series.dropna().iloc[i]) if pd.api.types.is_numeric_dtype(series) and i < len(series.dropna()) 
-                else str(series.dropna().iloc[i]) if i < len(series.dropna())
-                else None
-                for i in range(min(5, len(series.dropna())))
-            ],
-            "stats": {}
-        }
-        if pd.api.types.is_numeric_dtype(series):
-            desc = series.describe()
-            summary["stats"] = {k: (float(v) if pd.notna(v) else None) for k, v in desc.items()}
-        columns.append(summary)
+            "non_null": int(non_null[col]),
+            "nulls": int(nulls[col]),
+            "unique": int(unique[col]),
+            "zeros": int(zeros[col]) if is_numeric else 0,
+            "sample_values": [float(v) for v in sample] if is_numeric else [str(v) for v in sample],
+            "stats": {k: (float(v) if pd.notna(v) else None) for k, v in desc[col].items()} if is_numeric else {}
+        })
 
     class_balance = None
     if target_column and target_column in df.columns:
-        counts = df[target_column].value_counts(dropna=False).to_dict()
-        class_balance = {str(k): int(v) for k, v in counts.items()}
+        # Arrow's hash kernel beats pandas value_counts + a Python to_dict
+        # walk on high-cardinality targets; nulls are tallied explicitly,
+        # matching the parquet path
+        arr = pa.Array.from_pandas(df[target_column])
+        counts = pc.value_counts(arr.drop_null())
+        class_balance = {str(entry["values"]): int(entry["counts"]) for entry in counts.to_pylist()}
+        if arr.null_count:
+            class_balance[str(None)] = int(arr.null_count)
 
     return {
         "dataset_name": dataset_name,
@@ -202,8 +336,10 @@ async def manual_apply(request: ManualApplyRequest, background_tasks: Background
             "manual_operations": request.operations.dict()
         },
         "ai_analysis": False,
-        "created_at": datetime.now().isoformat()
+        "created_at": _now_iso()
     }
+    _evict_old_jobs()
+    _save_jobs()
 
     background_tasks.add_task(
         run_preprocessing,
@@ -227,42 +363,16 @@ async def manual_apply(request: ManualApplyRequest, background_tasks: Background
 async def ai_analyze_for_preprocessing(dataset_name: str):
     """Use AI to analyze dataset and suggest preprocessing steps"""
     # Resolve dataset location: uploads/, data/, or processed parquet
-    filepath = f"data/uploads/{dataset_name}"
-    if not os.path.exists(filepath):
-        alt_path = f"data/{dataset_name}"
-        if os.path.exists(alt_path):
-            filepath = alt_path
-        else:
-            # If a parquet name is provided directly, check in processed
-            if dataset_name.endswith('.parquet'):
-                parquet_direct = f"data/processed/{dataset_name}"
-                if os.path.exists(parquet_direct):
-                    filepath = parquet_direct
-                else:
-                    raise HTTPException(status_code=404, detail="Dataset not found")
-            else:
-                # Try to find processed parquet version (same name, different extension)
-                base_name = dataset_name
-                if base_name.endswith('.csv'):
-                    base_name = base_name[:-4]
-                # Try new naming convention first (same name, different extension)
-                parquet_path = f"data/processed/{base_name}.parquet"
-                # Fallback to old naming convention for backward compatibility
-                if not os.path.exists(parquet_path):
-                    old_parquet_path = f"data/processed/processed_{base_name}.parquet"
-                    if os.path.exists(old_parquet_path):
-                        parquet_path = old_parquet_path
-                    else:
-                        raise HTTPException(status_code=404, detail="Dataset not found")
-                filepath = parquet_path
-    
+    resolved = resolve_dataset(dataset_name)
+    if resolved is None:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    filepath, _ = resolved
+
     try:
-        # Load dataset (CSV or Parquet)
-        if filepath.endswith('.parquet'):
-            df = pd.read_parquet(filepath)
-        else:
-            df = pd.read_csv(filepath, low_memory=False)
-        
+        # Cached multithreaded parse, run off the event loop (the AI service
+        # computes whole-frame stats, so it does need the full DataFrame)
+        df = await asyncio.to_thread(load_df, filepath)
+
         # Get AI analysis
         analysis = await ai_service.analyze_dataset_for_preprocessing(df, dataset_name)
         
@@ -291,30 +401,32 @@ async def download_processed_data(job_id: str):
     processed_path = job.get("processed_path")
     if not processed_path:
         # Fallback: construct filename (keep same name, change extension)
-        base_name = job['dataset_name']
-        if base_name.endswith('.csv'):
-            base_name = base_name[:-4]
-        elif base_name.endswith('.parquet'):
-            base_name = base_name[:-8]
-        processed_filename = f"{base_name}.parquet"
-        processed_path = f"data/processed/{processed_filename}"
+        base_name = job['dataset_name'].removesuffix('.csv').removesuffix('.parquet')
+        processed_path = f"{PROCESSED_DIR}/{base_name}.parquet"
     
-    if not os.path.exists(processed_path):
+    try:
+        stat = os.stat(processed_path)  # doubles as the existence check
+    except OSError:
         raise HTTPException(status_code=404, detail=f"Processed file not found at {processed_path}")
-    
+
+    # stat_result lets Starlette skip its own stat and take the zero-copy
+    # sendfile path; Accept-Ranges makes interrupted downloads resumable.
+    # (filename comes from the path: the local variable only existed on the
+    # fallback branch and was a NameError when the job carried its own path)
     return FileResponse(
         processed_path,
-        filename=processed_filename,
-        media_type='application/octet-stream'
+        filename=os.path.basename(processed_path),
+        media_type='application/octet-stream',
+        stat_result=stat,
+        headers={"Accept-Ranges": "bytes"}
     )
 
 @router.get("/reports/{job_id}")
 async def get_preprocessing_report(job_id: str):
     """Get the preprocessing report"""
     # Clean job_id - remove .html extension if present
-    if job_id.endswith('.html'):
-        job_id = job_id[:-5]  # Remove .html extension
-    
+    job_id = job_id.removesuffix(_REPORT_SUFFIX)
+
     # First, try to get report path from job if it exists in memory
     report_path = None
     if job_id in preprocessing_jobs:
@@ -326,82 +438,107 @@ async def get_preprocessing_report(job_id: str):
     
     # If not found in job, try default naming convention
     if not report_path:
-        report_path = f"data/artifacts/preprocessing_report_{job_id}.html"
+        report_path = f"{ARTIFACTS_DIR}/{_REPORT_PREFIX}{job_id}{_REPORT_SUFFIX}"
     
-    # Check if report file exists
-    if not os.path.exists(report_path):
-        # Try searching the artifacts directory for any matching file
-        artifacts_dir = "data/artifacts"
-        if os.path.exists(artifacts_dir):
-            for filename in os.listdir(artifacts_dir):
-                if filename.startswith(f"preprocessing_report_{job_id}"):
-                    report_path = os.path.join(artifacts_dir, filename)
-                    print(f"📄 Found report file: {report_path}")
-                    break
-        
+    # Check if report file exists (the stat doubles as the FileResponse prefetch)
+    try:
+        stat = os.stat(report_path)
+    except OSError:
+        stat = None
+    if stat is None:
+        # Consult the report index (one scandir on first miss, O(1) after);
+        # the scan runs on a worker thread so it can't stall the event loop
+        if not _report_index_built:
+            await asyncio.to_thread(_build_report_index)
+        indexed_path = _report_index.get(job_id)
+        if indexed_path:
+            report_path = indexed_path
+            print(f"📄 Found report file: {report_path}")
+
         # If still not found, raise error
-        if not os.path.exists(report_path):
+        try:
+            stat = os.stat(report_path)
+        except OSError:
             print(f"❌ Report not found for job_id: {job_id}")
             print(f"   Tried path: {report_path}")
-            # List available reports for debugging
-            if os.path.exists(artifacts_dir):
-                available = [f for f in os.listdir(artifacts_dir) if f.startswith("preprocessing_report_")]
-                print(f"   Available reports: {available[:5]}")  # Show first 5
             raise HTTPException(status_code=404, detail=f"Preprocessing report not found for job {job_id}. The report file may not exist or the job may not have completed successfully.")
-    
+
     print(f"✅ Serving report: {report_path}")
-    return FileResponse(report_path, media_type='text/html', headers={"Content-Disposition": f'inline; filename="preprocessing_report_{job_id}.html"'})
+    # stat_result lets Starlette skip its own stat and take the zero-copy
+    # sendfile path when the server supports it
+    return FileResponse(report_path, media_type='text/html', stat_result=stat,
+                        headers={"Content-Disposition": f'inline; filename="preprocessing_report_{job_id}.html"'})
 
 @router.get("/reports")
-async def list_preprocessing_reports():
+async def list_preprocessing_reports(request: Request, response: Response):
     """List all available preprocessing reports"""
-    artifacts_dir = "data/artifacts"
-    if not os.path.exists(artifacts_dir):
+    # Directory mtime plus the jobs version fingerprints the listing: a new
+    # report bumps the former, new job metadata bumps the latter
+    try:
+        etag = f'"{os.stat(ARTIFACTS_DIR).st_mtime_ns}-{_jobs_version}"'
+    except OSError:
         return {"reports": []}
-    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    # The scan is the only real filesystem work in this router's read
+    # endpoints, so it runs on a worker thread; the single-stat handlers
+    # stay inline because a thread hop costs more than one syscall.
+    return {"reports": await asyncio.to_thread(_scan_reports)}
+
+def _scan_reports() -> list:
+    if not os.path.exists(ARTIFACTS_DIR):
+        return []
+
     reports = []
-    for filename in os.listdir(artifacts_dir):
-        if filename.startswith("preprocessing_report_") and filename.endswith(".html"):
-            filepath = os.path.join(artifacts_dir, filename)
-            stat = os.stat(filepath)
-            job_id = filename.replace("preprocessing_report_", "").replace(".html", "")
-            
-            # Get job info if available
-            job_info = {}
-            if job_id in preprocessing_jobs:
-                job_data = preprocessing_jobs[job_id]
-                job_info = {
-                    "dataset_name": job_data.get("dataset_name", "Unknown"),
-                    "status": job_data.get("status", "Unknown"),
-                    "created_at": job_data.get("created_at", ""),
-                    "completed_at": job_data.get("completed_at", "")
-                }
-            
-            reports.append({
-                "filename": filename,
-                "job_id": job_id,
-                "size": stat.st_size,
-                "created": stat.st_ctime,
-                "url": f"/api/preprocessing/reports/{job_id}",
-                **job_info
-            })
-    
-    return {"reports": sorted(reports, key=lambda x: x["created"], reverse=True)}
+    # scandir hands back cached stat data, one syscall per entry instead of two
+    with os.scandir(ARTIFACTS_DIR) as it:
+        for entry in it:
+            filename = entry.name
+            if filename.startswith(_REPORT_PREFIX) and filename.endswith(_REPORT_SUFFIX):
+                stat = entry.stat()
+                job_id = filename[len(_REPORT_PREFIX):-len(_REPORT_SUFFIX)]
+
+                # Get job info if available
+                job_info = {}
+                if job_id in preprocessing_jobs:
+                    job_data = preprocessing_jobs[job_id]
+                    job_info = {
+                        "dataset_name": job_data.get("dataset_name", "Unknown"),
+                        "status": job_data.get("status", "Unknown"),
+                        "created_at": job_data.get("created_at", ""),
+                        "completed_at": job_data.get("completed_at", "")
+                    }
+
+                reports.append({
+                    "filename": filename,
+                    "job_id": job_id,
+                    "size": stat.st_size,
+                    "created": stat.st_ctime,
+                    "url": f"/api/preprocessing/reports/{job_id}",
+                    **job_info
+                })
+
+    return sorted(reports, key=lambda x: x["created"], reverse=True)
 
 @router.get("/view/{filename}")
 async def view_preprocessing_report(filename: str):
     """Serve preprocessing report HTML file directly in browser"""
     # Ensure it's a preprocessing report, not an EDA report
-    if not filename.startswith("preprocessing_report_") or not filename.endswith(".html"):
+    if not filename.startswith(_REPORT_PREFIX) or not filename.endswith(_REPORT_SUFFIX):
         raise HTTPException(status_code=400, detail="Invalid preprocessing report filename")
-    
-    filepath = f"data/artifacts/{filename}"
-    if not os.path.exists(filepath):
+
+    filepath = f"{ARTIFACTS_DIR}/{filename}"
+    try:
+        stat = os.stat(filepath)  # doubles as the existence check
+    except OSError:
         raise HTTPException(status_code=404, detail="Preprocessing report not found")
-    
+
     return FileResponse(
         path=filepath,
         media_type='text/html',
+        stat_result=stat,
         headers={"Content-Disposition": f'inline; filename="{filename}"'}
     )
 
@@ -418,35 +555,9 @@ async def start_manual_preprocessing(
 ):
     """Start manual preprocessing with specific options"""
     # Resolve dataset location: uploads/, data/, or processed parquet
-    filepath = f"data/uploads/{dataset_name}"
-    if not os.path.exists(filepath):
-        alt_path = f"data/{dataset_name}"
-        if os.path.exists(alt_path):
-            filepath = alt_path
-        else:
-            # If a parquet name is provided directly, check in processed
-            if dataset_name.endswith('.parquet'):
-                parquet_direct = f"data/processed/{dataset_name}"
-                if os.path.exists(parquet_direct):
-                    filepath = parquet_direct
-                else:
-                    raise HTTPException(status_code=404, detail="Dataset not found")
-            else:
-                # Try to find processed parquet version (same name, different extension)
-                base_name = dataset_name
-                if base_name.endswith('.csv'):
-                    base_name = base_name[:-4]
-                # Try new naming convention first (same name, different extension)
-                parquet_path = f"data/processed/{base_name}.parquet"
-                # Fallback to old naming convention for backward compatibility
-                if not os.path.exists(parquet_path):
-                    old_parquet_path = f"data/processed/processed_{base_name}.parquet"
-                    if os.path.exists(old_parquet_path):
-                        parquet_path = old_parquet_path
-                    else:
-                        raise HTTPException(status_code=404, detail="Dataset not found")
-                filepath = parquet_path
-    
+    if resolve_dataset(dataset_name) is None:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+
     # Create preprocessing request
     preprocessing_options = {
         "handle_missing_values": handle_missing_values,
@@ -473,9 +584,11 @@ async def start_manual_preprocessing(
         "dataset_name": dataset_name,
         "preprocessing_options": preprocessing_options,
         "ai_analysis": False,
-        "created_at": datetime.now().isoformat()
+        "created_at": _now_iso()
     }
-    
+    _evict_old_jobs()
+    _save_jobs()
+
     # Start preprocessing in background
     background_tasks.add_task(
         run_preprocessing,
@@ -492,7 +605,7 @@ async def start_manual_preprocessing(
 @router.delete("/reports/{filename}")
 async def delete_preprocessing_report(filename: str):
     """Delete a preprocessing report"""
-    filepath = f"data/artifacts/{filename}"
+    filepath = f"{ARTIFACTS_DIR}/{filename}"
     if not os.path.exists(filepath):
         raise HTTPException(status_code=404, detail="Preprocessing report not found")
     
@@ -507,34 +620,51 @@ async def run_preprocessing(job_id: str, request: PreprocessingRequest):
     try:
         print(f"🚀 Starting preprocessing job {job_id}")
         preprocessing_jobs[job_id]["status"] = "running"
-        
-        # Run preprocessing
-        result = await preprocessing_service.process_dataset(
-            request.dataset_name,
-            request.preprocessing_options,
-            request.ai_analysis,
-            request.selected_suggestions,
-            job_id
-        )
-        
+
+        # process_dataset is async but its pandas work runs synchronously and
+        # would pin the event loop for the whole job. Drive it on a worker
+        # thread with its own loop so status polls stay responsive while a
+        # large dataset is being processed.
+        def _process_sync():
+            return asyncio.run(preprocessing_service.process_dataset(
+                request.dataset_name,
+                request.preprocessing_options,
+                request.ai_analysis,
+                request.selected_suggestions,
+                job_id
+            ))
+
+        result = await asyncio.to_thread(_process_sync)
+
+        # Coerce numpy ints in the shapes here, once, instead of on every
+        # /jobs poll
+        if isinstance(result, dict):
+            for key in ("original_shape", "final_shape"):
+                if result.get(key):
+                    result[key] = tuple(int(x) for x in result[key])
+
         print(f"✅ Preprocessing job {job_id} completed successfully")
         preprocessing_jobs[job_id].update({
             "status": "completed",
             "result": result,
-            "completed_at": datetime.now().isoformat(),
+            "completed_at": _now_iso(),
             "report_path": result.get("report_path", ""),
             "report_filename": result.get("report_filename", ""),
             "processed_file": result.get("processed_file", ""),
             "processed_path": result.get("processed_path", "")
         })
+        if result.get("report_path"):
+            _report_index[job_id] = result["report_path"]
+        _save_jobs()
         print(f"📊 Job {job_id} updated with report_path: {result.get('report_path', 'N/A')}")
-        
+
     except Exception as e:
         error_msg = f"Preprocessing failed: {str(e)}"
         print(f"❌ Preprocessing job {job_id} failed: {error_msg}")
         preprocessing_jobs[job_id].update({
             "status": "failed",
             "error": error_msg,
-            "failed_at": datetime.now().isoformat()
+            "failed_at": _now_iso()
         })
+        _save_jobs()
 
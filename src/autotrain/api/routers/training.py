@@ -2,15 +2,21 @@
 Model training API endpoints
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 from ..schemas import TrainingRequest, TrainingResponse, TrainingResult
+import asyncio
 import pandas as pd
+import pyarrow.parquet as pq
 import os
+import traceback
 import uuid
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from threading import Lock
+from ... import logger
+from .._paths import resolve_dataset
 from ...services.training_service import TrainingService
 
 router = APIRouter()
@@ -29,7 +35,7 @@ def _load_training_jobs() -> dict:
                 if isinstance(data, dict):
                     return data
         except Exception as e:
-            print(f"Warning: Failed to load training jobs file: {e}")
+            logger.warning("Failed to load training jobs file: {}", e)
     return {}
 
 def _save_training_jobs():
@@ -38,42 +44,36 @@ def _save_training_jobs():
             with open(TRAINING_JOBS_FILE, "w", encoding="utf-8") as f:
                 json.dump(training_jobs, f, indent=2)
     except Exception as e:
-        print(f"Warning: Failed to persist training jobs: {e}")
+        logger.warning("Failed to persist training jobs: {}", e)
 
 training_jobs = _load_training_jobs()
 
+# Bounded worker pool instead of BackgroundTasks: acceptance is decoupled
+# from the CPU-heavy fit, excess jobs wait as "queued" rather than
+# oversubscribing the cores, and the event loop never runs training work.
+# Job state survives restarts through the persisted jobs file above.
+_TRAINING_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("MODULUS_TABULAR_TRAIN_CONCURRENCY", "1")),
+    thread_name_prefix="tab-train",
+)
+
 @router.post("/start", response_model=TrainingResponse)
-async def start_training(request: TrainingRequest, background_tasks: BackgroundTasks):
+async def start_training(request: TrainingRequest):
     """Start a new training job (CSV or Parquet)"""
     # Resolve dataset location: uploads/, data/, or processed parquet
-    filepath = f"data/uploads/{request.dataset_name}"
-    if not os.path.exists(filepath):
-        alt_path = f"data/{request.dataset_name}"
-        if os.path.exists(alt_path):
-            filepath = alt_path
-        else:
-            # Check if it's already a parquet file in processed directory
-            if request.dataset_name.endswith('.parquet'):
-                parquet_path = f"data/processed/{request.dataset_name}"
-                if os.path.exists(parquet_path):
-                    filepath = parquet_path
-                else:
-                    raise HTTPException(status_code=404, detail="Dataset not found")
-            else:
-                # Try to find processed parquet version
-                parquet_name = request.dataset_name.replace('.csv', '.parquet')
-                parquet_path = f"data/processed/processed_{parquet_name}"
-                if os.path.exists(parquet_path):
-                    filepath = parquet_path
-                else:
-                    raise HTTPException(status_code=404, detail="Dataset not found")
-    
+    resolved = resolve_dataset(request.dataset_name)
+    if resolved is None:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    filepath, _ = resolved
+
     job_id = str(uuid.uuid4())
-    
-    # Store job info
+
+    # Store job info (including the resolved path, so the worker doesn't
+    # re-walk the candidate locations)
     with training_jobs_lock:
         training_jobs[job_id] = {
-            "status": "running",
+            "status": "queued",
+            "filepath": filepath,
             "dataset_name": request.dataset_name,
             "task_type": request.task_type,
             "target_column": request.target_column,
@@ -81,14 +81,10 @@ async def start_training(request: TrainingRequest, background_tasks: BackgroundT
             "created_at": datetime.utcnow().isoformat()
         }
     _save_training_jobs()
-    
-    # Start training in background
-    background_tasks.add_task(
-        run_training,
-        job_id,
-        request
-    )
-    
+
+    # Hand off to the bounded pool; the handler returns immediately
+    _TRAINING_POOL.submit(run_training, job_id, request)
+
     return TrainingResponse(
         job_id=job_id,
         status="started",
@@ -115,7 +111,6 @@ async def get_training_status(job_id: str):
 @router.get("/jobs")
 async def list_training_jobs():
     """List all training jobs"""
-    print(f"Listing training jobs. Total jobs: {len(training_jobs)}")
     jobs = []
     with training_jobs_lock:
         for job_id, job_data in training_jobs.items():
@@ -131,52 +126,55 @@ async def list_training_jobs():
                 "created_at": job_data.get("created_at", "")
             }
             jobs.append(job_info)
-            print(f"Job {job_id}: {job_data.get('status', 'unknown')} - {job_data.get('dataset_name', 'Unknown')}")
-    print(f"Returning {len(jobs)} jobs")
+    logger.debug("Listing {} training jobs", len(jobs))
     jobs_sorted = sorted(jobs, key=lambda x: x.get("created_at", ""), reverse=True)
     return {"jobs": jobs_sorted}
 
-async def run_training(job_id: str, request: TrainingRequest):
-    """Background task to run training"""
+def run_training(job_id: str, request: TrainingRequest):
+    """Worker-thread entry point that runs one training job to completion"""
     try:
-        print(f"Starting training job {job_id} with dataset {request.dataset_name}")
-        
-        # Resolve dataset location: uploads/, data/, or processed parquet
-        filepath = f"data/uploads/{request.dataset_name}"
-        if not os.path.exists(filepath):
-            alt_path = f"data/{request.dataset_name}"
-            if os.path.exists(alt_path):
-                filepath = alt_path
-            else:
-                # Check if it's already a parquet file in processed directory
-                if request.dataset_name.endswith('.parquet'):
-                    parquet_path = f"data/processed/{request.dataset_name}"
-                    if os.path.exists(parquet_path):
-                        filepath = parquet_path
-                    else:
-                        raise Exception(f"Dataset not found: {request.dataset_name}")
-                else:
-                    # Try to find processed parquet version
-                    parquet_name = request.dataset_name.replace('.csv', '.parquet')
-                    parquet_path = f"data/processed/processed_{parquet_name}"
-                    if os.path.exists(parquet_path):
-                        filepath = parquet_path
-                    else:
-                        raise Exception(f"Dataset not found: {request.dataset_name}")
-        
-        # Load dataset (CSV or Parquet)
+        logger.info("Starting training job {} with dataset {}", job_id, request.dataset_name)
+
+        with training_jobs_lock:
+            training_jobs[job_id]["status"] = "running"
+        _save_training_jobs()
+
+        # The handler resolved the dataset when the job was accepted; only
+        # re-resolve if the path is missing (stale record) or has vanished
+        filepath = training_jobs[job_id].get("filepath")
+        if not filepath or not os.path.exists(filepath):
+            resolved = resolve_dataset(request.dataset_name)
+            if resolved is None:
+                raise Exception(f"Dataset not found: {request.dataset_name}")
+            filepath, _ = resolved
+
+        # Load dataset (CSV or Parquet). Excluded columns are pruned at
+        # read time: for parquet that's projection pushdown (their bytes
+        # are never decoded), for CSV the parser skips them.
+        exclude = set(request.exclude_columns or [])
+        exclude.discard(request.target_column)
         if filepath.endswith('.parquet'):
-            df = pd.read_parquet(filepath)
+            if exclude:
+                names = pq.ParquetFile(filepath).schema_arrow.names
+                keep = [c for c in names if c not in exclude]
+            else:
+                keep = None
+            # split_blocks + self_destruct release each Arrow buffer as it
+            # is converted, so the table and the DataFrame never coexist in
+            # full — roughly half the peak RSS of pd.read_parquet
+            table = pq.read_table(filepath, columns=keep)
+            df = table.to_pandas(split_blocks=True, self_destruct=True)
+            del table
         else:
-            df = pd.read_csv(filepath, sep=request.separator)
-        
-        print(f"Loaded dataset with shape: {df.shape}")
-        print(f"Columns: {list(df.columns)}")
-        print(f"Target column '{request.target_column}' values: {df[request.target_column].unique()}")
-        print(f"Using separator: '{request.separator}'")
+            usecols = (lambda c: c not in exclude) if exclude else None
+            df = pd.read_csv(filepath, sep=request.separator, usecols=usecols)
+
+        # Deferred formatting: the column dump is only built when DEBUG is on
+        logger.debug("Loaded dataset with shape {} (separator {!r})", df.shape, request.separator)
+        logger.opt(lazy=True).debug("Columns: {}", lambda: list(df.columns))
         
-        # Run training
-        result = await training_service.train_model(
+        # Run training (the coroutine gets its own loop on this thread)
+        result = asyncio.run(training_service.train_model(
             df=df,
             target_column=request.target_column,
             task_type=request.task_type,
@@ -188,10 +186,10 @@ async def run_training(job_id: str, request: TrainingRequest):
             scale_columns=request.scale_columns,
             null_handling=request.null_handling,
             null_fill_value=request.null_fill_value
-        )
-        
-        print(f"Training completed successfully for job {job_id}")
-        
+        ))
+
+        logger.info("Training completed successfully for job {}", job_id)
+
         # Update job status
         with training_jobs_lock:
             training_jobs[job_id].update({
@@ -203,37 +201,56 @@ async def run_training(job_id: str, request: TrainingRequest):
                 "completed_at": datetime.utcnow().isoformat()
             })
         _save_training_jobs()
-        print(f"Job {job_id} status updated to completed. Current jobs: {list(training_jobs.keys())}")
-        
+
     except Exception as e:
-        print(f"Training failed for job {job_id}: {str(e)}")
-        import traceback
+        # Format the traceback once: it goes to the log and into the job
+        # record, with no second raw write to stdout
         error_details = traceback.format_exc()
-        traceback.print_exc()
+        logger.error("Training failed for job {}: {}\n{}", job_id, e, error_details)
         with training_jobs_lock:
             training_jobs[job_id]["status"] = "failed"
             training_jobs[job_id]["error"] = str(e)
             training_jobs[job_id]["error_details"] = error_details
         _save_training_jobs()
 
+# Listing memoised on the directory mtime: a completed job writes its
+# report (and report_path) in the same transition that bumps it, so an
+# unchanged directory serves the cached list with one stat.
+_reports_cache = {"mtime_ns": -1, "items": []}
+
 @router.get("/reports")
 async def list_training_reports():
     """List all available training reports"""
     artifacts_dir = "data/artifacts"
-    if not os.path.exists(artifacts_dir):
+    try:
+        dir_mtime_ns = os.stat(artifacts_dir).st_mtime_ns
+    except OSError:
         return {"reports": []}
-    
+
+    if dir_mtime_ns == _reports_cache["mtime_ns"]:
+        return {"reports": _reports_cache["items"]}
+
+    # One pass over the jobs builds the report_path -> job join; the old
+    # code rescanned every job per file (O(files * jobs))
+    with training_jobs_lock:
+        report_jobs = {
+            job_data["report_path"]: (job_id, job_data)
+            for job_id, job_data in training_jobs.items()
+            if job_data.get("report_path")
+        }
+
     reports = []
-    for filename in os.listdir(artifacts_dir):
-        if filename.startswith("training_report_") and filename.endswith(".html"):
-            filepath = os.path.join(artifacts_dir, filename)
-            stat = os.stat(filepath)
-            
-            # Extract job info from filename (training_report_YYYYMMDD_HHMMSS.html)
-            # Try to find matching job by checking report_path in jobs
-            job_info = {}
-            for job_id, job_data in training_jobs.items():
-                if job_data.get("report_path") == filepath:
+    # scandir hands back cached stat data, one syscall per entry instead of two
+    with os.scandir(artifacts_dir) as it:
+        for entry in it:
+            filename = entry.name
+            if filename.startswith("training_report_") and filename.endswith(".html"):
+                stat = entry.stat()
+
+                job_info = {}
+                matched = report_jobs.get(os.path.join(artifacts_dir, filename))
+                if matched:
+                    job_id, job_data = matched
                     job_info = {
                         "job_id": job_id,
                         "dataset_name": job_data.get("dataset_name", "Unknown"),
@@ -243,17 +260,19 @@ async def list_training_reports():
                         "created_at": job_data.get("created_at", ""),
                         "accuracy": job_data.get("accuracy")
                     }
-                    break
-            
-            reports.append({
-                "filename": filename,
-                "size": stat.st_size,
-                "created": stat.st_ctime,
-                "url": f"/api/training/reports/{filename}",
-                **job_info
-            })
-    
-    return {"reports": sorted(reports, key=lambda x: x["created"], reverse=True)}
+
+                reports.append({
+                    "filename": filename,
+                    "size": stat.st_size,
+                    "created": stat.st_ctime,
+                    "url": f"/api/training/reports/{filename}",
+                    **job_info
+                })
+
+    reports.sort(key=lambda x: x["created"], reverse=True)
+    _reports_cache["mtime_ns"] = dir_mtime_ns
+    _reports_cache["items"] = reports
+    return {"reports": reports}
 
 @router.get("/reports/{filename}")
 async def get_training_report(filename: str):
@@ -263,12 +282,17 @@ async def get_training_report(filename: str):
         raise HTTPException(status_code=400, detail="Invalid training report filename")
     
     filepath = f"data/artifacts/{filename}"
-    if not os.path.exists(filepath):
+    try:
+        stat = os.stat(filepath)  # doubles as the existence check
+    except OSError:
         raise HTTPException(status_code=404, detail="Training report not found")
-    
+
+    # stat_result lets Starlette skip its own stat and take the zero-copy
+    # sendfile path when the server supports it
     return FileResponse(
         path=filepath,
         media_type='text/html',
+        stat_result=stat,
         headers={"Content-Disposition": f'inline; filename="{filename}"'}
     )
 
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional, Union
 
 from autotrain.trainers.image_classification.params import ImageClassificationParams
@@ -11,6 +12,12 @@ AVAILABLE_HARDWARE = {
     "local-ui": "local",
 }
 
+# Params class -> task id (default covers the regression case)
+_TASK_IDS = {
+    ImageClassificationParams: 18,
+    ImageRegressionParams: 24,
+}
+
 
 @dataclass
 class BaseBackend:
@@ -22,9 +29,17 @@ class BaseBackend:
             raise ValueError(f"Invalid backend: {self.backend}")
 
         self.username: Optional[str] = getattr(self.params, "username", None)
-        self.task_id = 18 if isinstance(self.params, ImageClassificationParams) else 24
+        self.task_id = _TASK_IDS.get(type(self.params), 24)
         self.wait = self.backend in {"local", "local-cli"}
-        self.env_vars = {
+
+    @cached_property
+    def env_vars(self) -> dict:
+        """Launch environment, built on first access.
+
+        model_dump_json serializes the whole params object; deferring it
+        means backends that are constructed but never launched skip it.
+        """
+        env = {
             "HF_TOKEN": getattr(self.params, "token", None),
             "AUTOTRAIN_USERNAME": self.username,
             "PROJECT_NAME": self.params.project_name,
@@ -33,4 +48,5 @@ class BaseBackend:
             "DATA_PATH": self.params.data_path,
         }
         if getattr(self.params, "model", None) is not None:
-            self.env_vars["MODEL"] = self.params.model
+            env["MODEL"] = self.params.model
+        return env
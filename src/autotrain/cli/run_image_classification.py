@@ -39,7 +39,7 @@ class RunAutoTrainImageClassificationCommand(BaseAutoTrainCommand):
             if "action" in arg:
                 run_image_classification_parser.add_argument(
                     *names,
-                    dest=arg["arg"].replace("--", "").replace("-", "_"),
+                    dest=arg.get("dest") or arg["arg"].replace("--", "").replace("-", "_"),
                     help=arg["help"],
                     required=arg.get("required", False),
                     action=arg.get("action"),
@@ -48,7 +48,7 @@ class RunAutoTrainImageClassificationCommand(BaseAutoTrainCommand):
             else:
                 run_image_classification_parser.add_argument(
                     *names,
-                    dest=arg["arg"].replace("--", "").replace("-", "_"),
+                    dest=arg.get("dest") or arg["arg"].replace("--", "").replace("-", "_"),
                     help=arg["help"],
                     required=arg.get("required", False),
                     type=arg.get("type"),
@@ -7,6 +7,9 @@ from autotrain.trainers.image_regression.params import ImageRegressionParams
 
 from . import BaseAutoTrainCommand
 
+# Built at import: the schema-derived argument list never changes at runtime
+_ARG_LIST = get_field_info(ImageRegressionParams)
+
 
 def run_image_regression_command_factory(args):
     return RunAutoTrainImageRegressionCommand(args)
@@ -15,7 +18,6 @@ def run_image_regression_command_factory(args):
 class RunAutoTrainImageRegressionCommand(BaseAutoTrainCommand):
     @staticmethod
     def register_subcommand(parser: ArgumentParser):
-        arg_list = get_field_info(ImageRegressionParams)
         arg_list = [
             {
                 "arg": "--train",
@@ -30,7 +32,7 @@ class RunAutoTrainImageRegressionCommand(BaseAutoTrainCommand):
                 "type": str,
                 "default": "local",
             },
-        ] + arg_list
+        ] + _ARG_LIST
         run_image_regression_parser = parser.add_parser(
             "image-regression", description="✨ Run AutoTrain Image Regression"
         )
@@ -39,7 +41,7 @@ class RunAutoTrainImageRegressionCommand(BaseAutoTrainCommand):
             if "action" in arg:
                 run_image_regression_parser.add_argument(
                     *names,
-                    dest=arg["arg"].replace("--", "").replace("-", "_"),
+                    dest=arg.get("dest") or arg["arg"].replace("--", "").replace("-", "_"),
                     help=arg["help"],
                     required=arg.get("required", False),
                     action=arg.get("action"),
@@ -48,7 +50,7 @@ class RunAutoTrainImageRegressionCommand(BaseAutoTrainCommand):
             else:
                 run_image_regression_parser.add_argument(
                     *names,
-                    dest=arg["arg"].replace("--", "").replace("-", "_"),
+                    dest=arg.get("dest") or arg["arg"].replace("--", "").replace("-", "_"),
                     help=arg["help"],
                     required=arg.get("required", False),
                     type=arg.get("type"),
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Type
 
 from autotrain.backends.base import AVAILABLE_HARDWARE
@@ -55,14 +56,22 @@ def get_default_value(field_data: dict) -> Any:
     return field_data.get("default")
 
 
+@lru_cache(maxsize=None)
 def get_field_info(params_class):
+    # model_json_schema walks every field and resolves refs; the result only
+    # depends on the class, so compute it once per params class. Callers
+    # treat the returned list as read-only (they prepend into new lists).
     schema = params_class.model_json_schema()
     properties = schema.get("properties", {})
     field_info = []
     for field_name, field_data in properties.items():
+        arg_name = f"--{field_name.replace('_', '-')}"
+        # The only distinct alias is the underscore spelling; for names
+        # without underscores it collapses into the primary and drops out
         temp_info = {
-            "arg": f"--{field_name.replace('_', '-')}",
-            "alias": [f"--{field_name}", f"--{field_name.replace('_', '-')}", f"--{field_name.replace('_', '_')}"],
+            "arg": arg_name,
+            "alias": [n for n in dict.fromkeys([f"--{field_name}"]) if n != arg_name],
+            "dest": field_name,
             "type": python_type_from_schema_field(field_data),
             "help": field_data.get("title", ""),
             "default": get_default_value(field_data),
@@ -1,5 +1,6 @@
 import os
 import shlex
+from functools import lru_cache
 
 import torch
 
@@ -29,56 +30,58 @@ def get_accelerate_command(num_gpus):
     ]
 
 
+# Params class -> trainer module; the command shape is otherwise identical
+_TRAINER_MODULES = {
+    ImageClassificationParams: "autotrain.trainers.image_classification",
+    ImageRegressionParams: "autotrain.trainers.image_regression",
+}
+
+
+@lru_cache(maxsize=1)
+def _detect_devices():
+    """Number of usable accelerator devices, probed once per process.
+
+    torch.cuda.is_available() initializes the driver on first call, which
+    is far from free; the answer doesn't change within a process.
+    """
+    if torch.cuda.is_available():
+        return torch.cuda.device_count()
+    if torch.backends.mps.is_available():
+        return 1
+    return 0
+
+
 def launch_command(params):
     params.project_name = shlex.split(params.project_name)[0]
-    cuda_available = torch.cuda.is_available()
-    mps_available = torch.backends.mps.is_available()
-    if cuda_available:
-        num_gpus = torch.cuda.device_count()
-    elif mps_available:
-        num_gpus = 1
-    else:
-        num_gpus = 0
-
-    if isinstance(params, ImageClassificationParams):
-        cmd = get_accelerate_command(num_gpus)
-        if num_gpus > 0:
-            cmd.append("--mixed_precision")
-            if params.mixed_precision == "fp16":
-                cmd.append("fp16")
-            elif params.mixed_precision == "bf16":
-                cmd.append("bf16")
-            else:
-                cmd.append("no")
-        cmd.extend(
-            [
-                "-m",
-                "autotrain.trainers.image_classification",
-                "--training_config",
-                os.path.join(params.project_name, "training_params.json"),
-            ]
-        )
-    elif isinstance(params, ImageRegressionParams):
-        cmd = get_accelerate_command(num_gpus)
-        if num_gpus > 0:
-            cmd.append("--mixed_precision")
-            if params.mixed_precision == "fp16":
-                cmd.append("fp16")
-            elif params.mixed_precision == "bf16":
-                cmd.append("bf16")
-            else:
-                cmd.append("no")
-        cmd.extend(
-            [
-                "-m",
-                "autotrain.trainers.image_regression",
-                "--training_config",
-                os.path.join(params.project_name, "training_params.json"),
-            ]
-        )
-    else:
+    num_gpus = _detect_devices()
+
+    module = next(
+        (mod for cls, mod in _TRAINER_MODULES.items() if isinstance(params, cls)),
+        None,
+    )
+    if module is None:
         raise ValueError("Unsupported params type")
 
+    # Copy: get_accelerate_command hands back the shared command constants,
+    # and the appends below must not grow them across calls
+    cmd = list(get_accelerate_command(num_gpus))
+    if num_gpus > 0:
+        cmd.append("--mixed_precision")
+        if params.mixed_precision == "fp16":
+            cmd.append("fp16")
+        elif params.mixed_precision == "bf16":
+            cmd.append("bf16")
+        else:
+            cmd.append("no")
+    cmd.extend(
+        [
+            "-m",
+            module,
+            "--training_config",
+            os.path.join(params.project_name, "training_params.json"),
+        ]
+    )
+
     logger.info(cmd)
     logger.info(params)
     return cmd
@@ -3,6 +3,7 @@ Application configuration
 """
 
 from pydantic_settings import BaseSettings
+from functools import lru_cache
 from typing import Optional
 import os
 
@@ -26,6 +27,9 @@ class Settings(BaseSettings):
     # ML settings
     max_file_size: int = 100 * 1024 * 1024  # 100MB
     supported_file_types: list = [".csv"]
+    # Snappy: near-free decompression keeps re-reads (training, previews)
+    # fast; gzip/zstd trade read latency for marginally smaller files
+    parquet_compression: str = "snappy"
     
     # CORS settings
     cors_origins: list = [
@@ -44,15 +48,20 @@ class Settings(BaseSettings):
         case_sensitive = False
         extra = "ignore"  # Ignore extra environment variables
 
-# Global settings instance
-settings = Settings()
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance"""
-    return settings
+    """Get the settings instance, constructed (and .env parsed) on first use"""
+    return Settings()
 
-# Create directories if they don't exist
-os.makedirs(settings.uploads_dir, exist_ok=True)
-os.makedirs(settings.artifacts_dir, exist_ok=True)
-os.makedirs(settings.exports_dir, exist_ok=True)
-os.makedirs(settings.processed_dir, exist_ok=True)
+def initialize_storage() -> None:
+    """Create the data directories. Called once from app startup rather than
+    at import time, so tooling (CLI, tests) can import config without
+    touching the filesystem."""
+    settings = get_settings()
+    for directory in (
+        settings.uploads_dir,
+        settings.artifacts_dir,
+        settings.exports_dir,
+        settings.processed_dir,
+    ):
+        os.makedirs(directory, exist_ok=True)
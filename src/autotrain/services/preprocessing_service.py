@@ -151,7 +151,7 @@ class PreprocessingService:
             
             # Save as parquet for better performance and compression
             try:
-                df.to_parquet(processed_path, index=False, compression='snappy')
+                df.to_parquet(processed_path, index=False, compression=self.settings.parquet_compression)
                 print(f"✅ Successfully saved parquet file: {processed_filename}")
             except Exception as e:
                 print(f"❌ Failed to save parquet: {e}")
@@ -57,11 +57,10 @@ class TrainingService:
         if scale_columns is None:
             scale_columns = []
         
-        # Create a copy of the dataframe
-        df_processed = df.copy()
-        
-        # Handle null values
-        df_processed = self._handle_nulls(df_processed, null_handling, null_fill_value)
+        # No defensive copy: _handle_nulls and the column drops below all
+        # return new frames, so the caller's df is never mutated and the
+        # up-front copy only doubled peak memory
+        df_processed = self._handle_nulls(df, null_handling, null_fill_value)
         
         # Exclude specified columns
         columns_to_drop = [col for col in exclude_columns if col in df_processed.columns]
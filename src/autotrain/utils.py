@@ -9,14 +9,20 @@ from autotrain.trainers.image_regression.params import ImageRegressionParams
 
 
 def run_training(params, task_id, local=False, wait=False):
-    params = json.loads(params)
+    # Already-validated params objects are used as-is; JSON strings (the
+    # backend/env-var path) keep the parse + validate round-trip.
     if isinstance(params, str):
         params = json.loads(params)
-    if task_id == 18:
-        params = ImageClassificationParams(**params)
-    elif task_id == 24:
-        params = ImageRegressionParams(**params)
-    else:
+        if isinstance(params, str):
+            params = json.loads(params)
+    if isinstance(params, dict):
+        if task_id == 18:
+            params = ImageClassificationParams(**params)
+        elif task_id == 24:
+            params = ImageRegressionParams(**params)
+        else:
+            raise NotImplementedError
+    elif not isinstance(params, (ImageClassificationParams, ImageRegressionParams)):
         raise NotImplementedError
 
     params.save(output_dir=params.project_name)